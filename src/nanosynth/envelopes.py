@@ -151,6 +151,10 @@ class Envelope(UGenSerializable):
         self._envelope_segments = tuple(
             _zip_cycled(self._amplitudes, self._durations, self._curves)
         )
+        # Envelopes are immutable, so both wire formats are built on first
+        # use and shared by every EnvGen the envelope is passed to.
+        self._serialized: UGenVector | None = None
+        self._compiled: tuple[float, ...] | None = None
 
     @staticmethod
     def _flatten(item: UGenOperable | float) -> UGenOperable | float:
@@ -281,6 +285,8 @@ class Envelope(UGenSerializable):
         Inputs may be OutputProxy references when envelope parameters
         are driven by other UGens.
         """
+        if self._serialized is not None:
+            return self._serialized
         result: list[UGenOperable | float] = []
         result.append(self.initial_amplitude)
         result.append(len(self.envelope_segments))
@@ -300,9 +306,8 @@ class Envelope(UGenSerializable):
             UGenVector(*cast(Sequence[SupportsFloat | UGenOperable], x))
             for x in _expand_deep(result)
         ]
-        if len(expanded) == 1:
-            return expanded[0]
-        return UGenVector(*expanded)
+        self._serialized = expanded[0] if len(expanded) == 1 else UGenVector(*expanded)
+        return self._serialized
 
     def compile(self) -> tuple[float, ...]:
         """Compile envelope to SCgf-compatible float sequence.
@@ -314,6 +319,8 @@ class Envelope(UGenSerializable):
         Raises:
             TypeError: If any parameter is a UGen (cannot flatten to float).
         """
+        if self._compiled is not None:
+            return self._compiled
         result: list[float] = []
 
         def _to_float(value: UGenOperable | float | int) -> float:
@@ -337,7 +344,8 @@ class Envelope(UGenSerializable):
             else:
                 result.append(float(int(EnvelopeShape.CUSTOM)))
                 result.append(_to_float(curve))
-        return tuple(result)
+        self._compiled = tuple(result)
+        return self._compiled
 
     @property
     def amplitudes(self) -> tuple[UGenOperable | float, ...]:
@@ -403,6 +411,8 @@ class EnvGen(UGen):
         envelope: An ``Envelope`` instance. Serialized automatically.
     """
 
+    __slots__ = ()
+
     _ordered_keys = (
         "gate",
         "level_scale",
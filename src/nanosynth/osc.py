@@ -2,6 +2,7 @@
 
 import contextlib
 import datetime
+import functools
 import socket
 import struct
 import time
@@ -21,6 +22,23 @@ SYSTEM_EPOCH = datetime.date(*time.gmtime(0)[0:3])
 NTP_EPOCH = datetime.date(1900, 1, 1)
 NTP_DELTA = (SYSTEM_EPOCH - NTP_EPOCH).days * 24 * 3600
 
+_INT32 = struct.Struct(">i")
+_UINT32 = struct.Struct(">I")
+_FLOAT32 = struct.Struct(">f")
+_FLOAT64 = struct.Struct(">d")
+_DECODED_CONSTANTS: dict[str, bool | None] = {"T": True, "F": False, "N": None}
+
+
+@functools.lru_cache(maxsize=1024)
+def _encode_pattern(value: str) -> bytes:
+    """Encode an address or type-tag string, caching the padded result.
+
+    Clients send the same few address patterns and argument shapes over and
+    over (``/n_set`` with ``,isf``, ``/s_new`` with ``,siii...``), so these
+    are worth memoizing, unlike arbitrary string arguments.
+    """
+    return OscMessage._encode_string(value)
+
 
 OscArgument = Union[
     "OscBundle",
@@ -35,16 +53,9 @@ OscArgument = Union[
 
 
 def _group_by_count(iterable: SequenceABC[Any], count: int) -> Iterator[list[Any]]:
-    """Split an iterable into chunks of ``count`` items."""
-    iterator = iter(iterable)
-    result: list[Any] = []
-    for item in iterator:
-        result.append(item)
-        if len(result) == count:
-            yield result
-            result = []
-    if result:
-        yield result
+    """Split a sequence into chunks of ``count`` items."""
+    for i in range(0, len(iterable), count):
+        yield list(iterable[i : i + count])
 
 
 def format_datagram(datagram: bytes | bytearray) -> str:
@@ -86,6 +97,8 @@ class OscMessage:
             OscMessage, OscBundle, or sequences thereof).
     """
 
+    __slots__ = ("address", "contents")
+
     def __init__(self, address: int | str, *contents: OscArgument) -> None:
         if not isinstance(address, (str, int)):
             raise ValueError(f"address must be int or str, got {address}")
@@ -112,18 +125,21 @@ class OscMessage:
         return format_datagram(bytearray(self.to_datagram()))
 
     @staticmethod
-    def _decode_blob(data: bytes) -> tuple[bytes, bytes]:
-        actual_length, remainder = struct.unpack(">I", data[:4])[0], data[4:]
+    def _decode_blob(data: bytes, offset: int) -> tuple[bytes, int]:
+        actual_length = _UINT32.unpack_from(data, offset)[0]
+        offset += 4
         padded_length = actual_length
         if actual_length % 4 != 0:
             padded_length = (actual_length // 4 + 1) * 4
-        return remainder[:padded_length][:actual_length], remainder[padded_length:]
+        return data[offset : offset + actual_length], offset + padded_length
 
     @staticmethod
-    def _decode_string(data: bytes) -> tuple[str, bytes]:
-        actual_length = data.index(b"\x00")
+    def _decode_string(data: bytes, offset: int) -> tuple[str, int]:
+        actual_length = data.index(b"\x00", offset) - offset
         padded_length = (actual_length // 4 + 1) * 4
-        return str(data[:actual_length], "ascii"), data[padded_length:]
+        return str(
+            data[offset : offset + actual_length], "ascii"
+        ), offset + padded_length
 
     @staticmethod
     def _encode_string(value: str) -> bytes:
@@ -142,38 +158,46 @@ class OscMessage:
         return result
 
     @classmethod
-    def _encode_value(cls, value: OscArgument) -> tuple[str, bytes]:
-        type_tags, encoded_value = "", b""
-        if isinstance(value, (OscBundle, OscMessage)):
-            type_tags += "b"
-            encoded_value = cls._encode_blob(value.to_datagram())
-        elif isinstance(value, (bytearray, bytes)):
-            type_tags += "b"
-            encoded_value = cls._encode_blob(bytes(value))
+    def _encode_value(
+        cls, value: OscArgument, type_tags: list[str], data: bytearray
+    ) -> None:
+        # Exact-type checks first: plain floats and ints are the bulk of
+        # server traffic. Subclasses (bool included) fall through to the
+        # isinstance chain below.
+        value_type = type(value)
+        if value_type is float:
+            type_tags.append("f")
+            data += _FLOAT32.pack(value)
+        elif value_type is int:
+            type_tags.append("i")
+            data += _INT32.pack(value)
         elif isinstance(value, str):
-            type_tags += "s"
-            encoded_value = cls._encode_string(value)
+            type_tags.append("s")
+            data += cls._encode_string(value)
+        elif isinstance(value, (OscBundle, OscMessage)):
+            type_tags.append("b")
+            data += cls._encode_blob(value.to_datagram())
+        elif isinstance(value, (bytearray, bytes)):
+            type_tags.append("b")
+            data += cls._encode_blob(bytes(value))
         elif isinstance(value, bool):
-            type_tags += "T" if value else "F"
+            type_tags.append("T" if value else "F")
         elif isinstance(value, float):
-            type_tags += "f"
-            encoded_value += struct.pack(">f", value)
+            type_tags.append("f")
+            data += _FLOAT32.pack(value)
         elif isinstance(value, int):
-            type_tags += "i"
-            encoded_value += struct.pack(">i", value)
+            type_tags.append("i")
+            data += _INT32.pack(value)
         elif value is None:
-            type_tags += "N"
+            type_tags.append("N")
         elif isinstance(value, SequenceABC):
-            type_tags += "["
+            type_tags.append("[")
             for sub_value in value:
-                sub_type_tags, sub_encoded_value = cls._encode_value(sub_value)
-                type_tags += sub_type_tags
-                encoded_value += sub_encoded_value
-            type_tags += "]"
+                cls._encode_value(sub_value, type_tags, data)
+            type_tags.append("]")
         else:
             message = "Cannot encode {!r}".format(value)
             raise TypeError(message)
-        return type_tags, encoded_value
 
     def to_datagram(self) -> bytes:
         """Encode this message to an OSC binary datagram."""
@@ -186,18 +210,16 @@ class OscMessage:
                 )
         # Fallback: pure Python
         if isinstance(self.address, str):
-            encoded_address = self._encode_string(self.address)
+            datagram = bytearray(_encode_pattern(self.address))
         else:
-            encoded_address = struct.pack(">i", self.address)
-        encoded_type_tags = ","
-        encoded_contents = b""
+            datagram = bytearray(_INT32.pack(self.address))
+        type_tags = [","]
+        encoded_contents = bytearray()
         for value in self.contents or ():
-            type_tags, encoded_value = self._encode_value(value)
-            encoded_type_tags += type_tags
-            encoded_contents += encoded_value
-        return (
-            encoded_address + self._encode_string(encoded_type_tags) + encoded_contents
-        )
+            self._encode_value(value, type_tags, encoded_contents)
+        datagram += _encode_pattern("".join(type_tags))
+        datagram += encoded_contents
+        return bytes(datagram)
 
     @classmethod
     def from_datagram(cls, datagram: bytes) -> "OscMessage":
@@ -205,40 +227,37 @@ class OscMessage:
         if _osc_native is not None:
             address, contents = _osc_native.decode_message(datagram)
             return cls(address, *contents)
-        # Fallback: pure Python
-        remainder = datagram
-        address, remainder = cls._decode_string(remainder)
-        type_tags, remainder = cls._decode_string(remainder)
+        # Fallback: pure Python. Read in place by offset rather than slicing
+        # off a new remainder after every argument.
+        address, offset = cls._decode_string(datagram, 0)
+        type_tags, offset = cls._decode_string(datagram, offset)
         contents_list: list[OscArgument] = []
         array_stack: list[list[OscArgument]] = [contents_list]
         for type_tag in type_tags[1:]:
             if type_tag == "i":
-                value, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
-                array_stack[-1].append(value)
+                array_stack[-1].append(_INT32.unpack_from(datagram, offset)[0])
+                offset += 4
             elif type_tag == "f":
-                value, remainder = struct.unpack(">f", remainder[:4])[0], remainder[4:]
-                array_stack[-1].append(value)
-            elif type_tag == "d":
-                value, remainder = struct.unpack(">d", remainder[:8])[0], remainder[8:]
-                array_stack[-1].append(value)
+                array_stack[-1].append(_FLOAT32.unpack_from(datagram, offset)[0])
+                offset += 4
+            elif type_tag in _DECODED_CONSTANTS:
+                array_stack[-1].append(_DECODED_CONSTANTS[type_tag])
             elif type_tag == "s":
-                value, remainder = cls._decode_string(remainder)
+                value, offset = cls._decode_string(datagram, offset)
                 array_stack[-1].append(value)
+            elif type_tag == "d":
+                array_stack[-1].append(_FLOAT64.unpack_from(datagram, offset)[0])
+                offset += 8
             elif type_tag == "b":
-                value, remainder = cls._decode_blob(remainder)
+                blob, offset = cls._decode_blob(datagram, offset)
+                decoded: OscArgument = blob
                 for class_ in (OscBundle, OscMessage):
                     try:
-                        value = class_.from_datagram(value)
+                        decoded = class_.from_datagram(blob)
                         break
                     except (ValueError, IndexError, struct.error):
                         pass
-                array_stack[-1].append(value)
-            elif type_tag == "T":
-                array_stack[-1].append(True)
-            elif type_tag == "F":
-                array_stack[-1].append(False)
-            elif type_tag == "N":
-                array_stack[-1].append(None)
+                array_stack[-1].append(decoded)
             elif type_tag == "[":
                 array: list[OscArgument] = []
                 array_stack[-1].append(array)
@@ -276,6 +295,8 @@ class OscBundle:
         contents: Sequence of ``OscMessage`` and/or ``OscBundle`` instances.
     """
 
+    __slots__ = ("contents", "timestamp")
+
     def __init__(
         self,
         timestamp: float | None = None,
@@ -366,13 +387,13 @@ class OscBundle:
 
     def to_datagram(self, realtime: bool = True) -> bytes:
         """Encode this bundle to an OSC binary datagram."""
-        datagram: bytes = BUNDLE_PREFIX
+        datagram = bytearray(BUNDLE_PREFIX)
         datagram += self._encode_date(self.timestamp, realtime=realtime)
         for content in self.contents:
             content_datagram = content.to_datagram()
-            datagram += struct.pack(">i", len(content_datagram))
+            datagram += _INT32.pack(len(content_datagram))
             datagram += content_datagram
-        return datagram
+        return bytes(datagram)
 
     def to_list(self) -> list[Any]:
         result: list[Any] = [self.timestamp]
@@ -4,6 +4,7 @@ import atexit
 import concurrent.futures
 import enum
 import logging
+import operator
 import os
 import platform
 import threading
@@ -35,7 +36,7 @@ class ServerCannotBoot(Exception):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Options:
     """SuperCollider server options configuration.
 
@@ -152,28 +153,38 @@ def find_ugen_plugins_path() -> Path | None:
     return None
 
 
+# (world_new keyword, Options field) pairs copied through unchanged.
+_WORLD_KWARG_FIELDS = (
+    ("num_audio_bus_channels", "audio_bus_channel_count"),
+    ("num_input_bus_channels", "input_bus_channel_count"),
+    ("num_output_bus_channels", "output_bus_channel_count"),
+    ("num_control_bus_channels", "control_bus_channel_count"),
+    ("block_size", "block_size"),
+    ("num_buffers", "buffer_count"),
+    ("max_nodes", "maximum_node_count"),
+    ("max_graph_defs", "maximum_synthdef_count"),
+    ("max_wire_bufs", "wire_buffer_count"),
+    ("num_rgens", "random_number_generator_count"),
+    ("max_logins", "maximum_logins"),
+    ("realtime_memory_size", "memory_size"),
+    ("memory_locking", "memory_locking"),
+    ("realtime", "realtime"),
+    ("verbosity", "verbosity"),
+    ("rendezvous", "zero_configuration"),
+    ("shared_memory_id", "port"),
+)
+_WORLD_KWARG_NAMES = tuple(name for name, _ in _WORLD_KWARG_FIELDS)
+_get_world_kwarg_values = operator.attrgetter(
+    *(field for _, field in _WORLD_KWARG_FIELDS)
+)
+
+
 def _options_to_world_kwargs(options: Options) -> dict[str, Any]:
     """Map Options fields to _scsynth.world_new keyword arguments."""
-    kwargs: dict[str, Any] = {
-        "num_audio_bus_channels": options.audio_bus_channel_count,
-        "num_input_bus_channels": options.input_bus_channel_count,
-        "num_output_bus_channels": options.output_bus_channel_count,
-        "num_control_bus_channels": options.control_bus_channel_count,
-        "block_size": options.block_size,
-        "num_buffers": options.buffer_count,
-        "max_nodes": options.maximum_node_count,
-        "max_graph_defs": options.maximum_synthdef_count,
-        "max_wire_bufs": options.wire_buffer_count,
-        "num_rgens": options.random_number_generator_count,
-        "max_logins": options.maximum_logins,
-        "realtime_memory_size": options.memory_size,
-        "load_graph_defs": 1 if options.load_synthdefs else 0,
-        "memory_locking": options.memory_locking,
-        "realtime": options.realtime,
-        "verbosity": options.verbosity,
-        "rendezvous": options.zero_configuration,
-        "shared_memory_id": options.port,
-    }
+    kwargs: dict[str, Any] = dict(
+        zip(_WORLD_KWARG_NAMES, _get_world_kwarg_values(options))
+    )
+    kwargs["load_graph_defs"] = 1 if options.load_synthdefs else 0
     if options.sample_rate is not None:
         kwargs["preferred_sample_rate"] = options.sample_rate
     if options.hardware_buffer_size is not None:
@@ -207,6 +218,22 @@ def _options_to_world_kwargs(options: Options) -> dict[str, Any]:
 class EmbeddedProcessProtocol:
     """Process protocol that runs scsynth in-process via libscsynth."""
 
+    __slots__ = (
+        "_reply_callback",
+        "_world",
+        "boot_future",
+        "buffer_",
+        "error_text",
+        "exit_future",
+        "name",
+        "on_boot_callback",
+        "on_panic_callback",
+        "on_quit_callback",
+        "options",
+        "status",
+        "thread",
+    )
+
     _active_world: bool = False
     _active_world_lock: threading.Lock = threading.Lock()
 
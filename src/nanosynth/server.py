@@ -7,10 +7,10 @@ import itertools
 import logging
 import threading
 from collections.abc import Callable, Iterator
-from typing import TYPE_CHECKING, Any, SupportsInt
+from typing import TYPE_CHECKING, Any, SupportsInt, TypeVar
 
 from .enums import AddAction
-from .osc import OscMessage
+from .osc import OscBundle, OscMessage
 from .scsynth import BootStatus, EmbeddedProcessProtocol, Options
 
 if TYPE_CHECKING:
@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 # ---------------------------------------------------------------------------
 # Node proxy objects
@@ -192,6 +194,10 @@ class Server:
         self._reply_handlers: dict[str, list[Callable[..., Any]]] = {}
         self._pending_replies: dict[str, list[_ReplyEvent]] = {}
         self._reply_lock = threading.Lock()
+        # Per thread, so messages from other threads (including reply
+        # handlers on the engine callback thread) are never pulled into a
+        # bundle another thread is collecting.
+        self._bundle_local = threading.local()
 
     def __enter__(self) -> Server:
         self.boot()
@@ -238,20 +244,68 @@ class Server:
 
     # -- OSC -------------------------------------------------------------------
 
+    @property
+    def _bundle_contents(self) -> list[OscMessage] | None:
+        contents: list[OscMessage] | None = getattr(
+            self._bundle_local, "contents", None
+        )
+        return contents
+
     def send_msg(self, address: str, *args: OscArgument) -> None:
         """Send an OSC message to the engine."""
+        bundle_contents = self._bundle_contents
+        if bundle_contents is not None:
+            bundle_contents.append(OscMessage(address, *args))
+            return
         self._protocol.send_packet(OscMessage(address, *args).to_datagram())
 
+    @contextlib.contextmanager
+    def bundle(self) -> Iterator[None]:
+        """Collect messages sent in the block into one immediate OSC bundle.
+
+        The engine receives a single packet on exit and executes its
+        messages together in the same control block. Only messages sent
+        from the calling thread are collected. Nested ``bundle()`` blocks
+        join the outermost one. Nothing is sent if the block raises.
+        ``send_msg_sync()`` raises ``RuntimeError`` inside the block, since
+        its message would be held back until exit.
+
+        Usage::
+
+            with server.bundle():
+                low = server.synth("sine", frequency=220.0)
+                high = server.synth("sine", frequency=330.0)
+        """
+        if self._bundle_contents is not None:
+            yield
+            return
+        contents: list[OscMessage] = []
+        self._bundle_local.contents = contents
+        try:
+            yield
+        finally:
+            self._bundle_local.contents = None
+        if contents:
+            self._protocol.send_packet(OscBundle(contents=contents).to_datagram())
+
     # -- Reply handling --------------------------------------------------------
 
     def _dispatch_reply(self, data: bytes) -> None:
         """Route an incoming OSC reply to registered handlers and waiters."""
+        # Most replies (e.g. periodic /status.reply) have no listener, so
+        # check the null-terminated address before decoding the whole message.
+        try:
+            address = str(data[: data.index(b"\x00")], "ascii")
+        except ValueError:
+            logger.debug("Failed to decode OSC reply (%d bytes)", len(data))
+            return
+        if address not in self._reply_handlers and address not in self._pending_replies:
+            return
         try:
             msg = OscMessage.from_datagram(data)
         except Exception:
             logger.debug("Failed to decode OSC reply (%d bytes)", len(data))
             return
-        address = str(msg.address)
         with self._reply_lock:
             handlers = list(self._reply_handlers.get(address, []))
             waiters = self._pending_replies.pop(address, [])
@@ -287,7 +341,7 @@ class Server:
         event = _ReplyEvent()
         with self._reply_lock:
             self._pending_replies.setdefault(address, []).append(event)
-        return event.wait(timeout=timeout)
+        return self._await_reply(address, event, timeout)
 
     def send_msg_sync(
         self,
@@ -299,12 +353,32 @@ class Server:
         """Send a message and wait for a reply at *reply_address*.
 
         Returns the decoded reply OscMessage, or None on timeout.
+
+        Raises:
+            RuntimeError: If called inside a ``bundle()`` block.
         """
+        if self._bundle_contents is not None:
+            raise RuntimeError("send_msg_sync() cannot be used inside bundle()")
         event = _ReplyEvent()
         with self._reply_lock:
             self._pending_replies.setdefault(reply_address, []).append(event)
         self.send_msg(address, *args)
-        return event.wait(timeout=timeout)
+        return self._await_reply(reply_address, event, timeout)
+
+    def _await_reply(
+        self, address: str, event: _ReplyEvent, timeout: float
+    ) -> OscMessage | None:
+        message = event.wait(timeout=timeout)
+        if message is None:
+            # Timed out: deregister, so the stale waiter neither accumulates
+            # nor keeps replies at this address being decoded.
+            with self._reply_lock:
+                waiters = self._pending_replies.get(address, [])
+                if event in waiters:
+                    waiters.remove(event)
+                if not waiters:
+                    self._pending_replies.pop(address, None)
+        return message
 
     # -- SynthDef management ---------------------------------------------------
 
@@ -358,13 +432,24 @@ class Server:
         self.send_msg("/n_free", int(node_id))
 
     @contextlib.contextmanager
+    def _managed(
+        self, allocate: Callable[[], _T], release: Callable[[_T], None]
+    ) -> Iterator[_T]:
+        """Allocate a resource on entry and release it on exit if still running."""
+        resource = allocate()
+        try:
+            yield resource
+        finally:
+            if self.is_running:
+                release(resource)
+
     def managed_synth(
         self,
         name: str,
         target: int = 1,
         action: AddAction | int = AddAction.ADD_TO_HEAD,
         **params: float,
-    ) -> Iterator[Synth]:
+    ) -> contextlib.AbstractContextManager[Synth]:
         """Create a synth and free it on context exit.
 
         Usage::
@@ -373,26 +458,20 @@ class Server:
                 time.sleep(1)
             # node freed automatically
         """
-        node = self.synth(name, target=target, action=action, **params)
-        try:
-            yield node
-        finally:
-            if self.is_running:
-                self.free(node)
+        return self._managed(
+            lambda: self.synth(name, target=target, action=action, **params),
+            self.free,
+        )
 
-    @contextlib.contextmanager
     def managed_group(
         self,
         target: int = 0,
         action: AddAction | int = AddAction.ADD_TO_HEAD,
-    ) -> Iterator[Group]:
+    ) -> contextlib.AbstractContextManager[Group]:
         """Create a group and free it on context exit."""
-        node = self.group(target=target, action=action)
-        try:
-            yield node
-        finally:
-            if self.is_running:
-                self.free(node)
+        return self._managed(
+            lambda: self.group(target=target, action=action), self.free
+        )
 
     def set(self, node_id: SupportsInt, **params: float) -> None:
         """Set parameter values on a running node.
@@ -496,33 +575,26 @@ class Server:
         """Close the sound file associated with a buffer (after b_write)."""
         self.send_msg("/b_close", buffer_id)
 
-    @contextlib.contextmanager
     def managed_buffer(
         self,
         num_frames: int,
         num_channels: int = 1,
-    ) -> Iterator[int]:
+    ) -> contextlib.AbstractContextManager[int]:
         """Allocate a buffer and free it on context exit."""
-        buffer_id = self.alloc_buffer(num_frames, num_channels)
-        try:
-            yield buffer_id
-        finally:
-            if self.is_running:
-                self.free_buffer(buffer_id)
+        return self._managed(
+            lambda: self.alloc_buffer(num_frames, num_channels), self.free_buffer
+        )
 
-    @contextlib.contextmanager
     def managed_read_buffer(
         self,
         path: str,
         start_frame: int = 0,
         num_frames: int = -1,
-    ) -> Iterator[int]:
+    ) -> contextlib.AbstractContextManager[int]:
         """Read a sound file into a buffer and free it on context exit."""
-        buffer_id = self.read_buffer(
-            path, start_frame=start_frame, num_frames=num_frames
+        return self._managed(
+            lambda: self.read_buffer(
+                path, start_frame=start_frame, num_frames=num_frames
+            ),
+            self.free_buffer,
         )
-        try:
-            yield buffer_id
-        finally:
-            if self.is_running:
-                self.free_buffer(buffer_id)
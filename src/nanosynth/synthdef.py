@@ -5,14 +5,16 @@ Ported from supriya's ugens/core.py -- minimal subset for defining UGen graphs
 in Python and compiling them to SuperCollider's SCgf binary format.
 """
 
+import contextvars
 import copy
 import enum
+import functools
 import hashlib
 import math
 import operator
-import threading
 import uuid
 from collections.abc import Sequence as SequenceABC
+from types import CodeType
 from typing import (
     Any,
     Callable,
@@ -22,6 +24,7 @@ from typing import (
     Protocol,
     SupportsFloat,
     SupportsInt,
+    TypeGuard,
     Union,
     cast,
     overload,
@@ -112,6 +115,12 @@ def _format_value(value: object) -> str:
     return value_repr
 
 
+def _is_float_like(value: object) -> TypeGuard[SupportsFloat]:
+    # SupportsFloat is a runtime-checkable Protocol whose isinstance() walks
+    # the protocol members on every call; answer for plain numbers first.
+    return isinstance(value, (float, int, SupportsFloat))
+
+
 def _get_fn_globals() -> dict[str, Any]:
     return {
         "CalculationRate": CalculationRate,
@@ -128,43 +137,55 @@ def _get_fn_globals() -> dict[str, Any]:
     }
 
 
-def _create_fn(
-    *,
-    cls: type["UGen"],
-    name: str,
-    args: list[str],
-    body: list[str],
-    return_type: Any,
-    globals_: dict[str, Any] | None = None,
-    decorator: Callable[..., Any] | None = None,
-    override: bool = False,
-) -> None:
-    if name in cls.__dict__ and not override:
+class _FnSpec(NamedTuple):
+    name: str
+    args: list[str]
+    body: list[str]
+    return_type: Any
+    decorator: Callable[..., Any] | None = None
+
+
+@functools.cache
+def _compile_fns(text: str) -> CodeType:
+    # Many UGens share a parameter signature (LPF/HPF, the C/L/N families),
+    # so identical generated sources are compiled only once.
+    return compile(text, "<string>", "exec")
+
+
+def _create_fns(cls: type["UGen"], fns: list[_FnSpec]) -> None:
+    # Compile all of a class's generated methods with a single exec().
+    fns = [fn for fn in fns if fn.name not in cls.__dict__]
+    if not fns:
         return
-    globals_ = globals_ or {}
-    locals_ = {"_return_type": return_type}
-    args_ = ",\n        ".join(args)
-    body_ = "\n".join(f"        {line}" for line in body)
-    text = f"    def {name}(\n        {args_}\n    ) -> _return_type:\n{body_}"
+    locals_ = {f"_return_type_{i}": fn.return_type for i, fn in enumerate(fns)}
+    texts = []
+    for i, fn in enumerate(fns):
+        args_ = ",\n        ".join(fn.args)
+        body_ = "\n".join(f"        {line}" for line in fn.body)
+        texts.append(
+            f"    def {fn.name}(\n        {args_}\n    ) -> _return_type_{i}:\n{body_}"
+        )
     local_vars = ", ".join(locals_.keys())
-    text = f"def __create_fn__({local_vars}):\n{text}\n    return {name}"
+    names = ", ".join(fn.name for fn in fns)
+    text = "\n".join(texts)
+    text = f"def __create_fn__({local_vars}):\n{text}\n    return ({names},)"
     namespace: dict[str, Callable[..., Any]] = {}
-    exec(text, globals_, namespace)
-    value = namespace["__create_fn__"](**locals_)
-    value.__qualname__ = f"{cls.__qualname__}.{value.__name__}"
-    value.__module__ = cls.__module__
-    if decorator:
-        value = decorator(value)
-    setattr(cls, name, value)
+    exec(_compile_fns(text), {**_get_fn_globals(), "UGen": UGen}, namespace)
+    values = namespace["__create_fn__"](**locals_)
+    for fn, value in zip(fns, values):
+        value.__qualname__ = f"{cls.__qualname__}.{value.__name__}"
+        value.__module__ = cls.__module__
+        if fn.decorator:
+            value = fn.decorator(value)
+        setattr(cls, fn.name, value)
 
 
-def _add_init(
-    cls: type["UGen"],
+def _init_fn(
     params: dict[str, Param],
     is_multichannel: bool,
     channel_count: int,
     fixed_channel_count: bool,
-) -> None:
+) -> _FnSpec:
     parent_class = UGen
     args = ["self", "*", "calculation_rate: CalculationRate"]
     body = [
@@ -195,41 +216,34 @@ def _add_init(
     args.append("**kwargs")
     body.append("    **kwargs,")
     body.append(")")
-    _create_fn(
-        cls=cls,
-        name="__init__",
-        args=args,
-        body=body,
-        globals_={**_get_fn_globals(), parent_class.__name__: parent_class},
-        return_type=None,
-    )
+    return _FnSpec(name="__init__", args=args, body=body, return_type=None)
 
 
 def _add_param_fn(cls: type["UGen"], name: str, index: int, unexpanded: bool) -> None:
-    _create_fn(
-        cls=cls,
-        name=name,
-        args=["self"],
-        body=(
-            [f"return self._inputs[{index}:]"]
-            if unexpanded
-            else [f"return self._inputs[{index}]"]
-        ),
-        decorator=property,
-        globals_=_get_fn_globals(),
-        override=True,
-        return_type=UGenVector if unexpanded else UGenScalar,
-    )
+    # A plain closure; these need no generated signature, so skip exec().
+    if unexpanded:
 
+        def accessor(self: "UGen") -> Any:
+            return self._inputs[index:]
 
-def _add_rate_fn(
-    cls: type["UGen"],
+    else:
+
+        def accessor(self: "UGen") -> Any:
+            return self._inputs[index]
+
+    accessor.__name__ = name
+    accessor.__qualname__ = f"{cls.__qualname__}.{name}"
+    accessor.__module__ = cls.__module__
+    setattr(cls, name, property(accessor))
+
+
+def _rate_fn(
     rate: CalculationRate | None,
     params: dict[str, "Param"],
     is_multichannel: bool,
     channel_count: int,
     fixed_channel_count: bool,
-) -> None:
+) -> _FnSpec:
     args = ["cls"]
     if params:
         args.append("*")
@@ -251,14 +265,12 @@ def _add_rate_fn(
         body.append("    channel_count=channel_count,")
     body.extend(f"    {name}={name}," for name in params)
     body.append(")")
-    _create_fn(
-        cls=cls,
+    return _FnSpec(
         name=rate.token if rate is not None else "new",
         args=args,
         body=body,
-        decorator=classmethod,
-        globals_=_get_fn_globals(),
         return_type=UGenOperable,
+        decorator=classmethod,
     )
 
 
@@ -288,7 +300,7 @@ def _process_class(
         if value.unexpanded:
             unexpanded_keys.append(name)
         _add_param_fn(cls, name, len(params) - 1, value.unexpanded)
-    _add_init(cls, params, is_multichannel, channel_count, fixed_channel_count)
+    fns = [_init_fn(params, is_multichannel, channel_count, fixed_channel_count)]
     for should_add, rate in [
         (ar, CalculationRate.AUDIO),
         (kr, CalculationRate.CONTROL),
@@ -298,11 +310,12 @@ def _process_class(
     ]:
         if not should_add:
             continue
-        _add_rate_fn(
-            cls, rate, params, is_multichannel, channel_count, fixed_channel_count
+        fns.append(
+            _rate_fn(rate, params, is_multichannel, channel_count, fixed_channel_count)
         )
         if rate is not None:
             valid_calculation_rates.append(rate)
+    _create_fns(cls, fns)
     cls._has_done_flag = bool(has_done_flag)
     cls._is_output = bool(is_output)
     cls._is_pure = bool(is_pure)
@@ -412,8 +425,8 @@ def _compute_binary_op(
             all_expanded_params = all_expanded_params[0]
         if isinstance(all_expanded_params, dict):
             if (
-                isinstance(left, SupportsFloat)
-                and isinstance(right, SupportsFloat)
+                _is_float_like(left)
+                and _is_float_like(right)
                 and float_operator is not None
             ):
                 return ConstantProxy(float_operator(float(left), float(right)))
@@ -427,8 +440,8 @@ def _compute_binary_op(
                 special_index=special_index,
                 **all_expanded_params,
             )
-        return UGenVector(
-            *(recurse(expanded_params) for expanded_params in all_expanded_params)
+        return UGenVector._from_operables(
+            recurse(expanded_params) for expanded_params in all_expanded_params
         )
 
     return recurse(UGen._expand_params({"left": left, "right": right}))
@@ -443,15 +456,18 @@ def _compute_unary_op(
         if not isinstance(all_expanded_params, dict) and len(all_expanded_params) == 1:
             all_expanded_params = all_expanded_params[0]
         if isinstance(all_expanded_params, dict):
-            if isinstance(source, SupportsFloat) and float_operator is not None:
-                return ConstantProxy(float_operator(float(source)))
+            # Fold per expanded channel, so constant elements of a vector
+            # source fold too.
+            expanded_source = all_expanded_params["source"]
+            if _is_float_like(expanded_source) and float_operator is not None:
+                return ConstantProxy(float_operator(float(expanded_source)))
             return UnaryOpUGen._new_single(
                 calculation_rate=max([CalculationRate.from_expr(source)]),
                 special_index=special_index,
                 **all_expanded_params,
             )
-        return UGenVector(
-            *(recurse(expanded_params) for expanded_params in all_expanded_params)
+        return UGenVector._from_operables(
+            recurse(expanded_params) for expanded_params in all_expanded_params
         )
 
     return recurse(UGen._expand_params({"source": source}))
@@ -964,6 +980,7 @@ class UGenOperable:
         return _compute_unary_op(
             source=self,
             special_index=UnaryOperator.FRACTIONAL_PART,
+            float_operator=lambda x: x - math.floor(x),
         )
 
     def sign(self) -> "UGenOperable":
@@ -971,6 +988,7 @@ class UGenOperable:
         return _compute_unary_op(
             source=self,
             special_index=UnaryOperator.SIGN,
+            float_operator=lambda x: float((x > 0) - (x < 0)),
         )
 
     def squared(self) -> "UGenOperable":
@@ -1015,6 +1033,7 @@ class UGenOperable:
         return _compute_unary_op(
             source=self,
             special_index=UnaryOperator.MIDICPS,
+            float_operator=lambda x: 440.0 * 2.0 ** ((x - 69.0) / 12.0),
         )
 
     def cpsmidi(self) -> "UGenOperable":
@@ -1022,6 +1041,7 @@ class UGenOperable:
         return _compute_unary_op(
             source=self,
             special_index=UnaryOperator.CPSMIDI,
+            float_operator=lambda x: math.log2(x / 440.0) * 12.0 + 69.0,
         )
 
     def midiratio(self) -> "UGenOperable":
@@ -1029,6 +1049,7 @@ class UGenOperable:
         return _compute_unary_op(
             source=self,
             special_index=UnaryOperator.MIDIRATIO,
+            float_operator=lambda x: 2.0 ** (x / 12.0),
         )
 
     def ratiomidi(self) -> "UGenOperable":
@@ -1036,6 +1057,7 @@ class UGenOperable:
         return _compute_unary_op(
             source=self,
             special_index=UnaryOperator.RATIOMIDI,
+            float_operator=lambda x: 12.0 * math.log2(x),
         )
 
     def dbamp(self) -> "UGenOperable":
@@ -1043,6 +1065,7 @@ class UGenOperable:
         return _compute_unary_op(
             source=self,
             special_index=UnaryOperator.DBAMP,
+            float_operator=lambda x: 10.0 ** (x / 20.0),
         )
 
     def ampdb(self) -> "UGenOperable":
@@ -1050,6 +1073,7 @@ class UGenOperable:
         return _compute_unary_op(
             source=self,
             special_index=UnaryOperator.AMPDB,
+            float_operator=lambda x: math.log10(x) * 20.0,
         )
 
     def octcps(self) -> "UGenOperable":
@@ -1057,6 +1081,7 @@ class UGenOperable:
         return _compute_unary_op(
             source=self,
             special_index=UnaryOperator.OCTCPS,
+            float_operator=lambda x: 440.0 * 2.0 ** (x - 4.75),
         )
 
     def cpsoct(self) -> "UGenOperable":
@@ -1064,6 +1089,7 @@ class UGenOperable:
         return _compute_unary_op(
             source=self,
             special_index=UnaryOperator.CPSOCT,
+            float_operator=lambda x: math.log2(x / 440.0) + 4.75,
         )
 
     def log_(self) -> "UGenOperable":
@@ -1155,6 +1181,7 @@ class UGenOperable:
         return _compute_unary_op(
             source=self,
             special_index=UnaryOperator.DISTORT,
+            float_operator=lambda x: x / (1.0 + abs(x)),
         )
 
     def softclip(self) -> "UGenOperable":
@@ -1162,6 +1189,7 @@ class UGenOperable:
         return _compute_unary_op(
             source=self,
             special_index=UnaryOperator.SOFTCLIP,
+            float_operator=lambda x: x if abs(x) <= 0.5 else (abs(x) - 0.25) / x,
         )
 
 
@@ -1177,11 +1205,18 @@ class UGenScalar(UGenOperable):
 class OutputProxy(UGenScalar):
     """A UGen output proxy -- reference to a specific output of a UGen."""
 
-    __slots__ = ("ugen", "index")
+    __slots__ = ("_hash", "index", "ugen")
 
     def __init__(self, ugen: "UGen", index: int) -> None:
         self.ugen = ugen
         self.index = index
+        # Proxies are dict keys during control remapping and topological
+        # sorting; hash once up front rather than on every lookup.
+        self._hash = hash((type(self), id(ugen), index))
+
+    def __reduce__(self) -> tuple[type["OutputProxy"], tuple["UGen", int]]:
+        # Rebuild through __init__ so copies rehash against the copied UGen.
+        return type(self), (self.ugen, self.index)
 
     def __eq__(self, expr: object) -> bool:
         return (
@@ -1191,7 +1226,7 @@ class OutputProxy(UGenScalar):
         )
 
     def __hash__(self) -> int:
-        return hash((type(self), id(self.ugen), self.index))
+        return self._hash
 
     def __repr__(self) -> str:
         return repr(self.ugen).replace(">", f"[{self.index}]>")
@@ -1210,7 +1245,7 @@ class ConstantProxy(UGenScalar):
         self.value = float(value)
 
     def __eq__(self, expr: object) -> bool:
-        if isinstance(expr, SupportsFloat):
+        if _is_float_like(expr):
             return float(self) == float(expr)
         return False
 
@@ -1236,7 +1271,7 @@ class UGenVector(UGenOperable, SequenceABC["UGenOperable"]):
                 values_.append(x)
             elif isinstance(x, UGenSerializable):
                 values_.append(UGenVector(*x.serialize()))
-            elif isinstance(x, SupportsFloat):
+            elif _is_float_like(x):
                 values_.append(ConstantProxy(float(x)))
             else:
                 raise ValueError(
@@ -1244,6 +1279,21 @@ class UGenVector(UGenOperable, SequenceABC["UGenOperable"]):
                 )
         self._values = tuple(values_)
 
+    @classmethod
+    def _from_operables(
+        cls, values: Iterable["UGenOperable | SupportsFloat"]
+    ) -> "UGenVector":
+        # For expansion results: skips __init__'s validation, but still wraps
+        # the bare floats that constant-folding _new_single methods return.
+        vector = cls.__new__(cls)
+        vector._values = tuple(
+            cast(Union["UGen", UGenScalar, "UGenVector"], value)
+            if isinstance(value, UGenOperable)
+            else ConstantProxy(float(value))
+            for value in values
+        )
+        return vector
+
     @overload
     def __getitem__(self, i: int) -> UGenOperable: ...
     @overload
@@ -1251,7 +1301,7 @@ class UGenVector(UGenOperable, SequenceABC["UGenOperable"]):
     def __getitem__(self, i: int | slice) -> "UGenOperable | UGenVector":
         if isinstance(i, int):
             return self._values[i]
-        return UGenVector(*self._values[i])
+        return UGenVector._from_operables(self._values[i])
 
     def __iter__(self) -> Iterator[UGenOperable]:
         yield from self._values
@@ -1269,17 +1319,16 @@ class SynthDefError(Exception):
     pass
 
 
-# Thread-local storage for active builders
-_local = threading.local()
-_local._active_builders = []
+# Context-local stack of active builders (isolated per thread and per
+# asyncio task).
+_active_builders: contextvars.ContextVar[tuple["SynthDefBuilder", ...]] = (
+    contextvars.ContextVar("nanosynth_active_builders", default=())
+)
 
 
-def _get_active_builders() -> list["SynthDefBuilder"]:
-    """Return the thread-local active builder stack, initializing if needed."""
-    if not hasattr(_local, "_active_builders"):
-        _local._active_builders = []
-    result: list[SynthDefBuilder] = _local._active_builders
-    return result
+def _get_active_builders() -> tuple["SynthDefBuilder", ...]:
+    """Return the active builder stack for the current context."""
+    return _active_builders.get()
 
 
 class UGen(UGenOperable, SequenceABC["UGenOperable"]):
@@ -1302,6 +1351,7 @@ class UGen(UGenOperable, SequenceABC["UGenOperable"]):
 
     __slots__ = (
         "_calculation_rate",
+        "_channel_count",
         "_special_index",
         "_inputs",
         "_input_keys",
@@ -1309,7 +1359,7 @@ class UGen(UGenOperable, SequenceABC["UGenOperable"]):
         "_values",
     )
 
-    _channel_count = 1
+    _channel_count: int
     _has_done_flag = False
     _is_output = False
     _is_pure = False
@@ -1324,6 +1374,8 @@ class UGen(UGenOperable, SequenceABC["UGenOperable"]):
         special_index: SupportsInt = 0,
         **kwargs: UGenRecursiveInput | None,
     ) -> None:
+        if not hasattr(self, "_channel_count"):
+            self._channel_count = 1
         calculation_rate, kwargs = self._postprocess_kwargs(
             calculation_rate=calculation_rate, **kwargs
         )
@@ -1359,7 +1411,7 @@ class UGen(UGenOperable, SequenceABC["UGenOperable"]):
                     inputs.append(float(x.value))
                 elif isinstance(x, OutputProxy):
                     inputs.append(x)
-                elif isinstance(x, SupportsFloat):
+                elif _is_float_like(x):
                     inputs.append(float(x))
                 else:
                     raise ValueError(
@@ -1373,7 +1425,7 @@ class UGen(UGenOperable, SequenceABC["UGenOperable"]):
         self._inputs = tuple(inputs)
         self._input_keys = tuple(input_keys)
         self._uuid: uuid.UUID | None = None
-        builders = _get_active_builders()
+        builders = _active_builders.get()
         if builders:
             builder = builders[-1]
             self._uuid = builder._uuid
@@ -1382,8 +1434,7 @@ class UGen(UGenOperable, SequenceABC["UGenOperable"]):
             if isinstance(input_, OutputProxy) and input_.ugen._uuid != self._uuid:
                 raise SynthDefError("UGen input in different scope")
         self._values = tuple(
-            OutputProxy(ugen=self, index=i)
-            for i in range(getattr(self, "_channel_count", 1))
+            OutputProxy(ugen=self, index=i) for i in range(self._channel_count)
         )
 
     @overload
@@ -1393,7 +1444,7 @@ class UGen(UGenOperable, SequenceABC["UGenOperable"]):
     def __getitem__(self, i: int | slice) -> UGenOperable | UGenVector:
         if isinstance(i, int):
             return self._values[i]
-        return UGenVector(*self._values[i])
+        return UGenVector._from_operables(self._values[i])
 
     def __iter__(self) -> Iterator[UGenOperable]:
         yield from self._values
@@ -1422,19 +1473,26 @@ class UGen(UGenOperable, SequenceABC["UGenOperable"]):
         params: dict[str, UGenRecursiveInput],
         unexpanded_keys: Iterable[str] | None = None,
     ) -> UGenRecursiveParams:
-        unexpanded_keys_ = set(unexpanded_keys or ())
+        # The @ugen decorator already freezes unexpanded keys; only copy
+        # ad hoc iterables so recursive calls share one frozenset.
+        unexpanded_keys_ = (
+            unexpanded_keys
+            if isinstance(unexpanded_keys, frozenset)
+            else frozenset(unexpanded_keys or ())
+        )
         size = 0
         for key, value in params.items():
             if isinstance(value, UGenSerializable):
                 params[key] = value = value.serialize()
-            if isinstance(value, (SupportsFloat, UGenScalar)):
+            if isinstance(value, UGenScalar) or _is_float_like(value):
                 continue
             elif isinstance(value, SequenceABC) and not isinstance(value, str):
                 if key in unexpanded_keys_:
                     if isinstance(value, SequenceABC) and any(
                         (
                             isinstance(x, SequenceABC)
-                            and not isinstance(x, (SupportsFloat, UGenScalar, str))
+                            and not isinstance(x, (UGenScalar, str))
+                            and not _is_float_like(x)
                         )
                         for x in value
                     ):
@@ -1451,12 +1509,13 @@ class UGen(UGenOperable, SequenceABC["UGenOperable"]):
             for key, value in params.items():
                 if isinstance(value, UGenSerializable):
                     value = value.serialize()
-                if isinstance(value, (SupportsFloat, UGenScalar)):
+                if isinstance(value, UGenScalar) or _is_float_like(value):
                     new_params[key] = value
                 elif isinstance(value, SequenceABC) and not isinstance(value, str):
                     if key in unexpanded_keys_:
                         if isinstance(value, SequenceABC) and all(
-                            isinstance(x, (SupportsFloat, UGenScalar)) for x in value
+                            (isinstance(x, UGenScalar) or _is_float_like(x))
+                            for x in value
                         ):
                             new_params[key] = value
                         else:
@@ -1464,7 +1523,7 @@ class UGen(UGenOperable, SequenceABC["UGenOperable"]):
                     else:
                         new_params[key] = value[i % len(value)]
             results.append(
-                cls._expand_params(new_params, unexpanded_keys=unexpanded_keys)
+                cls._expand_params(new_params, unexpanded_keys=unexpanded_keys_)
             )
         return results
 
@@ -1488,8 +1547,8 @@ class UGen(UGenOperable, SequenceABC["UGenOperable"]):
                     special_index=special_index,
                     **all_expanded_params,
                 )
-            return UGenVector(
-                *(recurse(expanded_params) for expanded_params in all_expanded_params)
+            return UGenVector._from_operables(
+                recurse(expanded_params) for expanded_params in all_expanded_params
             )
 
         filtered = {k: v for k, v in kwargs.items() if v is not None}
@@ -1559,6 +1618,8 @@ class UnaryOpUGen(UGen):
     which ``UnaryOperator`` to apply.
     """
 
+    __slots__ = ()
+
     _ordered_keys = ("source",)
     _is_pure = True
 
@@ -1578,11 +1639,46 @@ class UnaryOpUGen(UGen):
     def __repr__(self) -> str:
         return f"<UnaryOpUGen.{self.calculation_rate.token}({self.operator.name})>"
 
+    @classmethod
+    def _new_single(
+        cls,
+        *,
+        calculation_rate: CalculationRate | None = None,
+        special_index: SupportsInt = 0,
+        **kwargs: UGenRecursiveInput | None,
+    ) -> UGenOperable:
+        source = kwargs["source"]
+        # -(-x) = x
+        if (
+            special_index == UnaryOperator.NEGATIVE
+            and isinstance(source, OutputProxy)
+            and isinstance(source.ugen, UnaryOpUGen)
+            and source.ugen.special_index == UnaryOperator.NEGATIVE
+        ):
+            return cast(UGenOperable, source.ugen.inputs[0])
+        return super()._new_single(
+            calculation_rate=calculation_rate,
+            special_index=special_index,
+            **kwargs,
+        )
+
     @property
     def operator(self) -> UnaryOperator:
         return UnaryOperator(self.special_index)
 
 
+_COMMUTATIVE_OPERATORS = frozenset(
+    [
+        BinaryOperator.ADDITION,
+        BinaryOperator.MULTIPLICATION,
+        BinaryOperator.MINIMUM,
+        BinaryOperator.MAXIMUM,
+        BinaryOperator.EQUAL,
+        BinaryOperator.NOT_EQUAL,
+    ]
+)
+
+
 class BinaryOpUGen(UGen):
     """Applies a binary operator to two input signals.
 
@@ -1593,6 +1689,8 @@ class BinaryOpUGen(UGen):
     optimizations (e.g. ``x * 0 = 0``, ``x + 0 = x``, ``x ** 1 = x``).
     """
 
+    __slots__ = ()
+
     _ordered_keys = ("left", "right")
     _is_pure = True
 
@@ -1626,6 +1724,14 @@ class BinaryOpUGen(UGen):
             left: UGenScalar | float,
             right: UGenScalar | float,
         ) -> UGenOperable | float:
+            # Canonical operand order for commutative operators: constants
+            # first, so ``x * 2`` and ``2 * x`` produce identical graphs.
+            if (
+                special_index in _COMMUTATIVE_OPERATORS
+                and isinstance(right, float)
+                and not isinstance(left, float)
+            ):
+                left, right = right, left
             if special_index == BinaryOperator.MULTIPLICATION:
                 if left == 0 or right == 0:
                     return ConstantProxy(0)
@@ -1671,11 +1777,11 @@ class BinaryOpUGen(UGen):
 
         left = kwargs["left"]
         right = kwargs["right"]
-        if not isinstance(left, (SupportsFloat, UGenScalar)):
+        if not (isinstance(left, UGenScalar) or _is_float_like(left)):
             raise ValueError(
                 f"Left operand must be float or UGenScalar, got {type(left).__name__}"
             )
-        if not isinstance(right, (SupportsFloat, UGenScalar)):
+        if not (isinstance(right, UGenScalar) or _is_float_like(right)):
             raise ValueError(
                 f"Right operand must be float or UGenScalar, got {type(right).__name__}"
             )
@@ -1683,7 +1789,7 @@ class BinaryOpUGen(UGen):
             float(left) if isinstance(left, SupportsFloat) else left,
             float(right) if isinstance(right, SupportsFloat) else right,
         )
-        if isinstance(result, SupportsFloat) and not isinstance(result, UGenOperable):
+        if _is_float_like(result) and not isinstance(result, UGenOperable):
             return ConstantProxy(result)
         if not isinstance(result, UGenOperable):
             return ConstantProxy(float(result))
@@ -1709,6 +1815,8 @@ class Parameter(UGen):
     TRIGGER -> TrigControl, CONTROL+lag -> LagControl).
     """
 
+    __slots__ = ("lag", "name", "rate", "value")
+
     def __init__(
         self,
         *,
@@ -1754,6 +1862,8 @@ class Control(UGen):
     trigger-rate parameters respectively.
     """
 
+    __slots__ = ("_parameters",)
+
     def __init__(
         self,
         *,
@@ -1774,10 +1884,12 @@ class Control(UGen):
 
 
 class AudioControl(Control):
-    pass
+    __slots__ = ()
 
 
 class LagControl(Control):
+    __slots__ = ()
+
     _ordered_keys = ("lags",)
     _unexpanded_keys = frozenset(["lags"])
 
@@ -1802,7 +1914,7 @@ class LagControl(Control):
 
 
 class TrigControl(Control):
-    pass
+    __slots__ = ()
 
 
 # ---------------------------------------------------------------------------
@@ -1991,6 +2103,7 @@ class SynthDefBuilder:
         | float,
     ) -> None:
         self._building = False
+        self._context_tokens: list[contextvars.Token[tuple[SynthDefBuilder, ...]]] = []
         self._parameters: dict[str, Parameter] = {}
         self._ugens: list[UGen] = []
         self._uuid = uuid.uuid4()
@@ -2024,7 +2137,9 @@ class SynthDefBuilder:
                 self.add_parameter(name=key, value=value)
 
     def __enter__(self) -> "SynthDefBuilder":
-        _get_active_builders().append(self)
+        self._context_tokens.append(
+            _active_builders.set(_active_builders.get() + (self,))
+        )
         return self
 
     def __exit__(
@@ -2033,7 +2148,7 @@ class SynthDefBuilder:
         exc_value: BaseException | None,
         traceback: Any,
     ) -> None:
-        _get_active_builders().pop()
+        _active_builders.reset(self._context_tokens.pop())
 
     def __getitem__(self, item: str) -> OutputProxy | Parameter:
         """Look up a parameter by name.
@@ -2181,45 +2296,59 @@ class SynthDefBuilder:
             filtered[index:index] = [max_local_bufs.ugen]
         return filtered
 
-    def _optimize(self, ugens: list[UGen]) -> list[UGen]:
-        sort_bundles = self._initiate_topological_sort(ugens)
+    def _optimize(
+        self,
+        ugens: list[UGen],
+        sort_bundles: dict[UGen, "SynthDefBuilder.SortBundle"],
+    ) -> list[UGen]:
         for ugen in ugens:
             ugen._optimize(sort_bundles)
-        return list(sort_bundles)
+        return [ugen for ugen in ugens if ugen in sort_bundles]
 
     def _remap_controls(
         self,
         ugens: list[UGen],
         control_mapping: dict[OutputProxy, OutputProxy],
     ) -> list[UGen]:
+        if not control_mapping:
+            return ugens
+        output_proxy = OutputProxy
+        get = control_mapping.get
         for ugen in ugens:
+            inputs = ugen._inputs
+            # Most UGens never reference a control; leave their inputs alone.
+            if not any(
+                isinstance(input_, output_proxy) and input_ in control_mapping
+                for input_ in inputs
+            ):
+                continue
             ugen._inputs = tuple(
-                (
-                    control_mapping.get(input_, input_)
-                    if isinstance(input_, OutputProxy)
-                    else input_
-                )
-                for input_ in ugen._inputs
+                get(input_, input_) if isinstance(input_, output_proxy) else input_
+                for input_ in inputs
             )
         return ugens
 
-    def _sort_topologically(self, ugens: list[UGen]) -> list[UGen]:
-        sort_bundles = self._initiate_topological_sort(ugens)
-        available_ugens: list[UGen] = []
+    def _sort_topologically(
+        self,
+        ugens: list[UGen],
+        sort_bundles: dict[UGen, "SynthDefBuilder.SortBundle"],
+    ) -> list[UGen]:
+        # Count pending antecedents rather than consuming the bundles, so the
+        # same bundles can be handed on to _optimize.
+        pending = {
+            ugen: len(sort_bundle.antecedents)
+            for ugen, sort_bundle in sort_bundles.items()
+        }
+        available_ugens: list[UGen] = [
+            ugen for ugen in reversed(ugens) if not pending[ugen]
+        ]
         output_stack: list[UGen] = []
-        for ugen in reversed(ugens):
-            if not sort_bundles[ugen].antecedents and ugen not in available_ugens:
-                available_ugens.append(ugen)
         while available_ugens:
             available_ugen = available_ugens.pop()
             for descendant in reversed(sort_bundles[available_ugen].descendants):
-                descendant_sort_bundle = sort_bundles[descendant]
-                descendant_sort_bundle.antecedents.remove(available_ugen)
-                if (
-                    not descendant_sort_bundle.antecedents
-                    and descendant_sort_bundle.ugen not in available_ugens
-                ):
-                    available_ugens.append(descendant_sort_bundle.ugen)
+                pending[descendant] -= 1
+                if not pending[descendant]:
+                    available_ugens.append(descendant)
             output_stack.append(available_ugen)
         return output_stack
 
@@ -2283,9 +2412,10 @@ class SynthDefBuilder:
                 ugens = controls + ugens
                 ugens = self._remap_controls(ugens, control_mapping)
                 ugens = self._cleanup_local_bufs(ugens)
-                ugens = self._sort_topologically(ugens)
+                sort_bundles = self._initiate_topological_sort(ugens)
+                ugens = self._sort_topologically(ugens, sort_bundles)
                 if optimize:
-                    ugens = self._optimize(ugens)
+                    ugens = self._optimize(ugens, sort_bundles)
         finally:
             self._building = False
         return SynthDef(ugens, name=name)
@@ -1,11 +1,11 @@
 """Basic utility UGens: MulAdd, Sum3, Sum4, Mix."""
 
-import itertools
 from collections.abc import Iterable, Sequence
 from typing import Any, SupportsInt, Union
 
 from ..enums import CalculationRate
 from ..synthdef import (
+    ConstantProxy,
     PseudoUGen,
     UGen,
     UGenOperable,
@@ -18,48 +18,85 @@ from ..synthdef import (
     ugen,
 )
 
+# Containers that _flatten descends into. Multi-output constructors (e.g.
+# Pan2.ar) return the UGen itself, whose channels must be expanded too.
+_CONTAINER_TYPES = (list, tuple, UGenVector, UGen)
+
+
+def _is_nested(x: Any) -> bool:
+    # Concrete containers are checked first; any other non-string iterable
+    # (a generator, a range, ...) is expanded too. UGenScalars iterate over
+    # themselves and are never expanded.
+    return isinstance(x, _CONTAINER_TYPES) or (
+        isinstance(x, Iterable) and not isinstance(x, (str, UGenScalar))
+    )
+
 
 def _flatten(
     iterable: Iterable[Any],
     terminal_types: type | tuple[type, ...] | None = None,
 ) -> list[Any]:
+    # Iterative depth-first walk: deeply nested inputs cannot hit the
+    # recursion limit, and no per-level result lists are built.
     result: list[Any] = []
-    for x in iterable:
-        if terminal_types and isinstance(x, terminal_types):
-            result.append(x)
-        elif isinstance(x, Iterable) and not isinstance(x, str):
-            result.extend(_flatten(x, terminal_types))
+    append = result.append
+    stack = [iter(iterable)]
+    while stack:
+        for x in stack[-1]:
+            if terminal_types and isinstance(x, terminal_types):
+                append(x)
+            elif _is_nested(x):
+                stack.append(iter(x))
+                break
+            else:
+                append(x)
         else:
-            result.append(x)
+            stack.pop()
     return result
 
 
-def _group_by_count(iterable: Iterable[Any], count: int) -> list[list[Any]]:
-    iterator = iter(iterable)
-    groups: list[list[Any]] = []
-    while True:
-        group = list(itertools.islice(iterator, count))
-        if not group:
-            break
-        groups.append(group)
-    return groups
-
-
-def _zip_cycled(*args: Sequence[Any]) -> list[tuple[Any, ...]]:
-    if not args:
-        return []
-    maximum_i = max(len(a) for a in args) - 1
-    cycles = [itertools.cycle(a) for a in args]
-    result: list[tuple[Any, ...]] = []
-    for i, values in enumerate(zip(*cycles)):
-        result.append(values)
-        if i == maximum_i:
-            break
-    return result
+def _sort_inputs_by_rate(
+    keys: tuple[str, ...], kwargs: dict[str, Any]
+) -> tuple[CalculationRate, dict[str, Any]]:
+    # Highest-rate inputs first; each rate is resolved once and the first
+    # one after sorting is the rate of the sum.
+    pairs = sorted(
+        ((CalculationRate.from_expr(kwargs[key]), kwargs[key]) for key in keys),
+        key=lambda pair: pair[0],
+        reverse=True,
+    )
+    for key, (_, value) in zip(keys, pairs):
+        kwargs[key] = value
+    return pairs[0][0], kwargs
+
+
+def _is_constant(value: object, constant: float) -> bool:
+    # Only numbers and ConstantProxy can equal a constant; skip the __eq__
+    # dispatch for every other graph input.
+    return isinstance(value, (int, float, ConstantProxy)) and value == constant
+
+
+_CONTROL_OR_SCALAR = frozenset([CalculationRate.CONTROL, CalculationRate.SCALAR])
+
+
+def _mul_add_inputs_are_valid(
+    source_rate: CalculationRate,
+    multiplier_rate: CalculationRate,
+    addend_rate: CalculationRate,
+) -> bool:
+    if source_rate == CalculationRate.AUDIO:
+        return True
+    return (
+        source_rate == CalculationRate.CONTROL
+        and multiplier_rate in _CONTROL_OR_SCALAR
+        and addend_rate in _CONTROL_OR_SCALAR
+    )
 
 
 @ugen(new=True)
 class MulAdd(UGen):
+    __slots__ = ()
+
     source = param()
     multiplier = param(1.0)
     addend = param(0.0)
@@ -75,26 +112,11 @@ class MulAdd(UGen):
         special_index: SupportsInt = 0,
         **kwargs: Union[UGenScalarInput, UGenVectorInput],
     ) -> UGenOperable:
-        def _inputs_are_valid(
-            source: UGenRecursiveInput,
-            multiplier: UGenRecursiveInput,
-            addend: UGenRecursiveInput,
-        ) -> bool:
-            if CalculationRate.from_expr(source) == CalculationRate.AUDIO:
-                return True
-            return (
-                CalculationRate.from_expr(source) == CalculationRate.CONTROL
-                and CalculationRate.from_expr(multiplier)
-                in (CalculationRate.CONTROL, CalculationRate.SCALAR)
-                and CalculationRate.from_expr(addend)
-                in (CalculationRate.CONTROL, CalculationRate.SCALAR)
-            )
-
-        if multiplier == 0.0:
+        if _is_constant(multiplier, 0.0):
             return addend  # type: ignore[return-value]
-        minus = multiplier == -1
-        no_multiplier = multiplier == 1
-        no_addend = addend == 0
+        minus = _is_constant(multiplier, -1)
+        no_multiplier = _is_constant(multiplier, 1)
+        no_addend = _is_constant(addend, 0)
         if no_multiplier and no_addend:
             return source  # type: ignore[return-value]
         if minus and no_addend:
@@ -105,22 +127,23 @@ class MulAdd(UGen):
             return addend - source  # type: ignore[operator]
         if no_multiplier:
             return source + addend  # type: ignore[operator]
-        if _inputs_are_valid(source, multiplier, addend):
+        # Resolve each operand's rate once for the checks below.
+        source_rate = CalculationRate.from_expr(source)
+        multiplier_rate = CalculationRate.from_expr(multiplier)
+        addend_rate = CalculationRate.from_expr(addend)
+        rate = max(source_rate, multiplier_rate, addend_rate)
+        if _mul_add_inputs_are_valid(source_rate, multiplier_rate, addend_rate):
             return cls(
                 addend=addend,
                 multiplier=multiplier,
-                calculation_rate=CalculationRate.from_expr(
-                    (source, multiplier, addend)
-                ),
+                calculation_rate=rate,
                 source=source,
             )[0]
-        if _inputs_are_valid(multiplier, source, addend):
+        if _mul_add_inputs_are_valid(multiplier_rate, source_rate, addend_rate):
             return cls(
                 addend=addend,
                 multiplier=source,
-                calculation_rate=CalculationRate.from_expr(
-                    (multiplier, source, addend)
-                ),
+                calculation_rate=rate,
                 source=multiplier,
             )[0]
         return (source * multiplier) + addend  # type: ignore[operator]
@@ -128,6 +151,8 @@ class MulAdd(UGen):
 
 @ugen(new=True)
 class Sum3(UGen):
+    __slots__ = ()
+
     input_one = param()
     input_two = param()
     input_three = param()
@@ -141,11 +166,11 @@ class Sum3(UGen):
         input_three: UGenRecursiveInput = 0,
         **kwargs: Any,
     ) -> UGenOperable:
-        if input_three == 0:
+        if _is_constant(input_three, 0):
             return input_one + input_two  # type: ignore[operator]
-        if input_two == 0:
+        if _is_constant(input_two, 0):
             return input_one + input_three  # type: ignore[operator]
-        if input_one == 0:
+        if _is_constant(input_one, 0):
             return input_two + input_three  # type: ignore[operator]
         return cls(
             calculation_rate=None,  # type: ignore[arg-type]
@@ -160,22 +185,13 @@ class Sum3(UGen):
         calculation_rate: CalculationRate,
         **kwargs: Any,
     ) -> tuple[CalculationRate, dict[str, Any]]:
-        inputs = sorted(
-            [kwargs["input_one"], kwargs["input_two"], kwargs["input_three"]],
-            key=lambda x: CalculationRate.from_expr(x),
-            reverse=True,
-        )
-        calculation_rate = CalculationRate.from_expr(inputs)
-        kwargs.update(
-            input_one=inputs[0],
-            input_two=inputs[1],
-            input_three=inputs[2],
-        )
-        return calculation_rate, kwargs
+        return _sort_inputs_by_rate(self._ordered_keys, kwargs)
 
 
 @ugen(new=True)
 class Sum4(UGen):
+    __slots__ = ()
+
     input_one = param()
     input_two = param()
     input_three = param()
@@ -191,25 +207,25 @@ class Sum4(UGen):
         input_four: UGenRecursiveInput = 0,
         **kwargs: Any,
     ) -> UGenOperable:
-        if input_one == 0:
+        if _is_constant(input_one, 0):
             return Sum3._new_single(
                 input_one=input_two,
                 input_two=input_three,
                 input_three=input_four,
             )
-        if input_two == 0:
+        if _is_constant(input_two, 0):
             return Sum3._new_single(
                 input_one=input_one,
                 input_two=input_three,
                 input_three=input_four,
             )
-        if input_three == 0:
+        if _is_constant(input_three, 0):
             return Sum3._new_single(
                 input_one=input_one,
                 input_two=input_two,
                 input_three=input_four,
             )
-        if input_four == 0:
+        if _is_constant(input_four, 0):
             return Sum3._new_single(
                 input_one=input_one,
                 input_two=input_two,
@@ -229,24 +245,7 @@ class Sum4(UGen):
         calculation_rate: CalculationRate,
         **kwargs: Any,
     ) -> tuple[CalculationRate, dict[str, Any]]:
-        inputs = sorted(
-            [
-                kwargs["input_one"],
-                kwargs["input_two"],
-                kwargs["input_three"],
-                kwargs["input_four"],
-            ],
-            key=lambda x: CalculationRate.from_expr(x),
-            reverse=True,
-        )
-        calculation_rate = CalculationRate.from_expr(inputs)
-        kwargs.update(
-            input_one=inputs[0],
-            input_two=inputs[1],
-            input_three=inputs[2],
-            input_four=inputs[3],
-        )
-        return calculation_rate, kwargs
+        return _sort_inputs_by_rate(self._ordered_keys, kwargs)
 
 
 class Mix(PseudoUGen):
@@ -257,39 +256,46 @@ class Mix(PseudoUGen):
         cls,
         sources: UGenRecursiveInput | Sequence[UGenRecursiveInput],
     ) -> UGenOperable:
-        if not isinstance(sources, Sequence):
+        if not isinstance(sources, _CONTAINER_TYPES):
             sources = [sources]
-        flat = _flatten(sources, terminal_types=UGenScalar)
-        summed_sources: list[UGenOperable] = []
-        for part in _group_by_count(flat, 4):
-            if len(part) == 4:
-                result = Sum4.new(  # type: ignore[attr-defined]
-                    input_one=part[0],
-                    input_two=part[1],
-                    input_three=part[2],
-                    input_four=part[3],
-                )
-                if isinstance(result, UGenVector):
-                    summed_sources.extend(result)
-                else:
-                    summed_sources.append(result)
-            elif len(part) == 3:
-                result = Sum3.new(  # type: ignore[attr-defined]
-                    input_one=part[0],
-                    input_two=part[1],
-                    input_three=part[2],
-                )
-                if isinstance(result, UGenVector):
-                    summed_sources.extend(result)
+        # Callers usually pass a flat list already; only walk it if needed.
+        current: list[Any] = (
+            _flatten(sources, terminal_types=UGenScalar)
+            if any(_is_nested(x) for x in sources)
+            else list(sources)
+        )
+        if not current:
+            raise ValueError("Mix requires at least one source")
+        # Sum in groups of four, level by level, until one signal remains.
+        # Sum3/Sum4 on scalar inputs always return a single output.
+        while len(current) > 1:
+            summed: list[Any] = []
+            for i in range(0, len(current), 4):
+                part = current[i : i + 4]
+                if len(part) == 4:
+                    summed.append(
+                        Sum4.new(  # type: ignore[attr-defined]
+                            input_one=part[0],
+                            input_two=part[1],
+                            input_three=part[2],
+                            input_four=part[3],
+                        )
+                    )
+                elif len(part) == 3:
+                    summed.append(
+                        Sum3.new(  # type: ignore[attr-defined]
+                            input_one=part[0],
+                            input_two=part[1],
+                            input_three=part[2],
+                        )
+                    )
+                elif len(part) == 2:
+                    summed.append(part[0] + part[1])
                 else:
-                    summed_sources.append(result)
-            elif len(part) == 2:
-                summed_sources.append(part[0] + part[1])
-            else:
-                summed_sources.append(part[0])
-        if len(summed_sources) == 1:
-            return summed_sources[0]
-        return Mix.new(summed_sources)
+                    summed.append(part[0])
+            current = summed
+        result: UGenOperable = current[0]
+        return result
 
     @classmethod
     def multichannel(
@@ -298,21 +304,26 @@ class Mix(PseudoUGen):
         channel_count: int,
     ) -> UGenVector:
         flat = _flatten(sources, terminal_types=UGenScalar)  # type: ignore[arg-type]
-        parts: list[list[Any]] = []
-        for i in range(0, len(flat), channel_count):
-            parts.append(flat[i : i + channel_count])
-        mixes: list[UGenOperable] = []
-        for columns in zip(*parts):
-            mixes.append(cls.new(list(columns)))
-        return UGenVector(*mixes)
+        # Channel i takes every channel_count-th source starting at i. As
+        # with zipping the rows, a trailing partial row keeps only the
+        # channels it fills.
+        row_count = -(-len(flat) // channel_count)
+        return UGenVector(
+            *(
+                cls.new(column)
+                for column in (flat[i::channel_count] for i in range(channel_count))
+                if column and len(column) == row_count
+            )
+        )
+
+
+_RATE_METHODS = {
+    CalculationRate.AUDIO: "ar",
+    CalculationRate.CONTROL: "kr",
+    CalculationRate.SCALAR: "ir",
+}
 
 
 def _get_method_for_rate(cls: type[UGen], calculation_rate: CalculationRate) -> Any:
     """Get the constructor method matching the calculation rate."""
-    if calculation_rate == CalculationRate.AUDIO:
-        return cls.ar  # type: ignore[attr-defined]
-    elif calculation_rate == CalculationRate.CONTROL:
-        return cls.kr  # type: ignore[attr-defined]
-    elif calculation_rate == CalculationRate.SCALAR:
-        return cls.ir  # type: ignore[attr-defined]
-    return cls.new  # type: ignore[attr-defined]
+    return getattr(cls, _RATE_METHODS.get(calculation_rate, "new"))
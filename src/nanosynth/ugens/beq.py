@@ -5,6 +5,8 @@ from ..synthdef import UGen, param, ugen
 
 @ugen(ar=True, is_pure=True)
 class BAllPass(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(1200.0)
     reciprocal_of_q = param(1.0)
@@ -12,6 +14,8 @@ class BAllPass(UGen):
 
 @ugen(ar=True, is_pure=True)
 class BBandPass(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(1200.0)
     bandwidth = param(1.0)
@@ -19,6 +23,8 @@ class BBandPass(UGen):
 
 @ugen(ar=True, is_pure=True)
 class BBandStop(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(1200.0)
     bandwidth = param(1.0)
@@ -26,6 +32,8 @@ class BBandStop(UGen):
 
 @ugen(ar=True, is_pure=True)
 class BHiCut(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(1200.0)
     order = param(2.0)
@@ -34,6 +42,8 @@ class BHiCut(UGen):
 
 @ugen(ar=True, is_pure=True)
 class BHiPass(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(1200.0)
     reciprocal_of_q = param(1.0)
@@ -41,6 +51,8 @@ class BHiPass(UGen):
 
 @ugen(ar=True, is_pure=True)
 class BHiShelf(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(1200.0)
     reciprocal_of_s = param(1.0)
@@ -49,6 +61,8 @@ class BHiShelf(UGen):
 
 @ugen(ar=True, is_pure=True)
 class BLowCut(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(1200.0)
     order = param(2.0)
@@ -57,6 +71,8 @@ class BLowCut(UGen):
 
 @ugen(ar=True, is_pure=True)
 class BLowPass(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(1200.0)
     reciprocal_of_q = param(1.0)
@@ -64,6 +80,8 @@ class BLowPass(UGen):
 
 @ugen(ar=True, is_pure=True)
 class BLowShelf(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(1200.0)
     reciprocal_of_s = param(1.0)
@@ -72,6 +90,8 @@ class BLowShelf(UGen):
 
 @ugen(ar=True, is_pure=True)
 class BPeakEQ(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(1200.0)
     reciprocal_of_q = param(1.0)
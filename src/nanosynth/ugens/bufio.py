@@ -14,6 +14,8 @@ from ..synthdef import (
 
 @ugen(ar=True, kr=True, is_multichannel=True)
 class BufRd(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     phase = param(0.0)
     loop = param(1)
@@ -22,6 +24,8 @@ class BufRd(UGen):
 
 @ugen(ar=True, kr=True, has_done_flag=True)
 class BufWr(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     phase = param(0.0)
     loop = param(1.0)
@@ -30,11 +34,15 @@ class BufWr(UGen):
 
 @ugen(ir=True, is_width_first=True)
 class ClearBuf(UGen):
+    __slots__ = ()
+
     buffer_id = param()
 
 
 @ugen(ir=True, is_width_first=True)
 class LocalBuf(UGen):
+    __slots__ = ()
+
     channel_count = param(1)
     frame_count = param(1)
 
@@ -49,11 +57,15 @@ class LocalBuf(UGen):
 
 @ugen(ir=True)
 class MaxLocalBufs(UGen):
+    __slots__ = ()
+
     maximum = param(0)
 
 
 @ugen(ar=True, kr=True, is_multichannel=True)
 class PlayBuf(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     rate = param(1)
     trigger = param(1)
@@ -64,6 +76,8 @@ class PlayBuf(UGen):
 
 @ugen(ar=True, kr=True, has_done_flag=True)
 class RecordBuf(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     offset = param(0.0)
     record_level = param(1.0)
@@ -77,12 +91,16 @@ class RecordBuf(UGen):
 
 @ugen(ar=True, kr=True)
 class ScopeOut(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     source = param(unexpanded=True)
 
 
 @ugen(ar=True, kr=True)
 class ScopeOut2(UGen):
+    __slots__ = ()
+
     scope_id = param()
     max_frames = param(4096)
     scope_frames = param(Default())
@@ -5,6 +5,8 @@ from ..synthdef import UGen, param, ugen
 
 @ugen(ar=True)
 class CuspL(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     a = param(1.0)
     b = param(1.9)
@@ -13,6 +15,8 @@ class CuspL(UGen):
 
 @ugen(ar=True)
 class CuspN(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     a = param(1.0)
     b = param(1.9)
@@ -21,6 +25,8 @@ class CuspN(UGen):
 
 @ugen(ar=True)
 class FBSineC(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     im = param(1.0)
     fb = param(0.1)
@@ -32,6 +38,8 @@ class FBSineC(UGen):
 
 @ugen(ar=True)
 class FBSineL(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     im = param(1.0)
     fb = param(0.1)
@@ -43,6 +51,8 @@ class FBSineL(UGen):
 
 @ugen(ar=True)
 class FBSineN(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     im = param(1.0)
     fb = param(0.1)
@@ -54,6 +64,8 @@ class FBSineN(UGen):
 
 @ugen(ar=True)
 class GbmanL(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     xi = param(1.2)
     yi = param(2.1)
@@ -61,6 +73,8 @@ class GbmanL(UGen):
 
 @ugen(ar=True)
 class GbmanN(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     xi = param(1.2)
     yi = param(2.1)
@@ -68,6 +82,8 @@ class GbmanN(UGen):
 
 @ugen(ar=True)
 class HenonC(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     a = param(1.4)
     b = param(0.3)
@@ -77,6 +93,8 @@ class HenonC(UGen):
 
 @ugen(ar=True)
 class HenonL(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     a = param(1.4)
     b = param(0.3)
@@ -86,6 +104,8 @@ class HenonL(UGen):
 
 @ugen(ar=True)
 class HenonN(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     a = param(1.4)
     b = param(0.3)
@@ -95,6 +115,8 @@ class HenonN(UGen):
 
 @ugen(ar=True)
 class LatoocarfianC(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     a = param(1)
     b = param(3)
@@ -106,6 +128,8 @@ class LatoocarfianC(UGen):
 
 @ugen(ar=True)
 class LatoocarfianL(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     a = param(1)
     b = param(3)
@@ -117,6 +141,8 @@ class LatoocarfianL(UGen):
 
 @ugen(ar=True)
 class LatoocarfianN(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     a = param(1)
     b = param(3)
@@ -128,6 +154,8 @@ class LatoocarfianN(UGen):
 
 @ugen(ar=True)
 class LinCongC(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     a = param(1.1)
     c = param(0.13)
@@ -137,6 +165,8 @@ class LinCongC(UGen):
 
 @ugen(ar=True)
 class LinCongL(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     a = param(1.1)
     c = param(0.13)
@@ -146,6 +176,8 @@ class LinCongL(UGen):
 
 @ugen(ar=True)
 class LinCongN(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     a = param(1.1)
     c = param(0.13)
@@ -155,6 +187,8 @@ class LinCongN(UGen):
 
 @ugen(ar=True)
 class LorenzL(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     s = param(10)
     r = param(28)
@@ -167,6 +201,8 @@ class LorenzL(UGen):
 
 @ugen(ar=True)
 class QuadC(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     a = param(1)
     b = param(-1)
@@ -176,6 +212,8 @@ class QuadC(UGen):
 
 @ugen(ar=True)
 class QuadL(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     a = param(1)
     b = param(-1)
@@ -185,6 +223,8 @@ class QuadL(UGen):
 
 @ugen(ar=True)
 class QuadN(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     a = param(1)
     b = param(-1)
@@ -194,6 +234,8 @@ class QuadN(UGen):
 
 @ugen(ar=True)
 class StandardL(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     k = param(1)
     xi = param(0.5)
@@ -202,6 +244,8 @@ class StandardL(UGen):
 
 @ugen(ar=True)
 class StandardN(UGen):
+    __slots__ = ()
+
     frequency = param(22050)
     k = param(1)
     xi = param(0.5)
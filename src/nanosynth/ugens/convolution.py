@@ -5,6 +5,8 @@ from ..synthdef import UGen, param, ugen
 
 @ugen(ar=True)
 class Convolution(UGen):
+    __slots__ = ()
+
     source = param()
     kernel = param()
     framesize = param(512)
@@ -12,6 +14,8 @@ class Convolution(UGen):
 
 @ugen(ar=True)
 class Convolution2(UGen):
+    __slots__ = ()
+
     source = param()
     kernel = param()
     trigger = param(0.0)
@@ -20,6 +24,8 @@ class Convolution2(UGen):
 
 @ugen(ar=True)
 class Convolution2L(UGen):
+    __slots__ = ()
+
     source = param()
     kernel = param()
     trigger = param(0.0)
@@ -29,6 +35,8 @@ class Convolution2L(UGen):
 
 @ugen(ar=True)
 class Convolution3(UGen):
+    __slots__ = ()
+
     source = param()
     kernel = param()
     trigger = param(0.0)
@@ -5,6 +5,8 @@ from ..synthdef import UGen, param, ugen
 
 @ugen(ar=True, kr=True, is_pure=True)
 class AllpassC(UGen):
+    __slots__ = ()
+
     source = param()
     maximum_delay_time = param(0.2)
     delay_time = param(0.2)
@@ -13,6 +15,8 @@ class AllpassC(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class AllpassL(UGen):
+    __slots__ = ()
+
     source = param()
     maximum_delay_time = param(0.2)
     delay_time = param(0.2)
@@ -21,6 +25,8 @@ class AllpassL(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class AllpassN(UGen):
+    __slots__ = ()
+
     source = param()
     maximum_delay_time = param(0.2)
     delay_time = param(0.2)
@@ -29,6 +35,8 @@ class AllpassN(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class BufAllpassC(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     source = param()
     maximum_delay_time = param(0.2)
@@ -38,6 +46,8 @@ class BufAllpassC(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class BufAllpassL(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     source = param()
     maximum_delay_time = param(0.2)
@@ -47,6 +57,8 @@ class BufAllpassL(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class BufAllpassN(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     source = param()
     maximum_delay_time = param(0.2)
@@ -56,6 +68,8 @@ class BufAllpassN(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class BufCombC(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     source = param()
     maximum_delay_time = param(0.2)
@@ -65,6 +79,8 @@ class BufCombC(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class BufCombL(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     source = param()
     maximum_delay_time = param(0.2)
@@ -74,6 +90,8 @@ class BufCombL(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class BufCombN(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     source = param()
     maximum_delay_time = param(0.2)
@@ -83,6 +101,8 @@ class BufCombN(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class BufDelayC(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     source = param()
     maximum_delay_time = param(0.2)
@@ -91,6 +111,8 @@ class BufDelayC(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class BufDelayL(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     source = param()
     maximum_delay_time = param(0.2)
@@ -99,6 +121,8 @@ class BufDelayL(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class BufDelayN(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     source = param()
     maximum_delay_time = param(0.2)
@@ -107,6 +131,8 @@ class BufDelayN(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class CombC(UGen):
+    __slots__ = ()
+
     source = param()
     maximum_delay_time = param(0.2)
     delay_time = param(0.2)
@@ -115,6 +141,8 @@ class CombC(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class CombL(UGen):
+    __slots__ = ()
+
     source = param()
     maximum_delay_time = param(0.2)
     delay_time = param(0.2)
@@ -123,6 +151,8 @@ class CombL(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class CombN(UGen):
+    __slots__ = ()
+
     source = param()
     maximum_delay_time = param(0.2)
     delay_time = param(0.2)
@@ -131,6 +161,8 @@ class CombN(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class DelTapRd(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     phase = param()
     delay_time = param(0.0)
@@ -139,12 +171,16 @@ class DelTapRd(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class DelTapWr(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     source = param()
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class DelayC(UGen):
+    __slots__ = ()
+
     source = param()
     maximum_delay_time = param(0.2)
     delay_time = param(0.2)
@@ -152,6 +188,8 @@ class DelayC(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class DelayL(UGen):
+    __slots__ = ()
+
     source = param()
     maximum_delay_time = param(0.2)
     delay_time = param(0.2)
@@ -159,6 +197,8 @@ class DelayL(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class DelayN(UGen):
+    __slots__ = ()
+
     source = param()
     maximum_delay_time = param(0.2)
     delay_time = param(0.2)
@@ -166,9 +206,13 @@ class DelayN(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Delay1(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Delay2(UGen):
+    __slots__ = ()
+
     source = param()
@@ -9,6 +9,7 @@ from ..synthdef import (
     UGenOperable,
     UGenRecursiveInput,
     UGenScalarInput,
+    UGenVector,
     param,
     ugen,
 )
@@ -16,6 +17,8 @@ from ..synthdef import (
 
 @ugen(dr=True)
 class Dbrown(UGen):
+    __slots__ = ()
+
     minimum = param(0.0)
     maximum = param(1.0)
     step = param(0.01)
@@ -24,6 +27,8 @@ class Dbrown(UGen):
 
 @ugen(dr=True)
 class Dbufrd(UGen):
+    __slots__ = ()
+
     buffer_id = param(0)
     phase = param(0)
     loop = param(1)
@@ -31,6 +36,8 @@ class Dbufrd(UGen):
 
 @ugen(dr=True)
 class Dbufwr(UGen):
+    __slots__ = ()
+
     source = param(0.0)
     buffer_id = param(0.0)
     phase = param(0.0)
@@ -39,6 +46,8 @@ class Dbufwr(UGen):
 
 @ugen(ar=True, kr=True)
 class Demand(UGen):
+    __slots__ = ()
+
     trigger = param(0)
     reset = param(0)
     source = param(unexpanded=True)
@@ -50,7 +59,7 @@ class Demand(UGen):
         **kwargs: UGenRecursiveInput | None,
     ) -> tuple[CalculationRate, dict[str, Any]]:
         source = kwargs["source"]
-        if not isinstance(source, Sequence):
+        if not isinstance(source, (list, tuple, UGenVector, UGen)):
             kwargs["source"] = [source]  # type: ignore[list-item]
         self._channel_count = len(kwargs["source"])  # type: ignore[arg-type]
         return calculation_rate, kwargs
@@ -58,6 +67,8 @@ class Demand(UGen):
 
 @ugen(ar=True, kr=True)
 class DemandEnvGen(UGen):
+    __slots__ = ()
+
     level = param()
     duration = param()
     shape = param(1)
@@ -72,6 +83,8 @@ class DemandEnvGen(UGen):
 
 @ugen(dr=True)
 class Dgeom(UGen):
+    __slots__ = ()
+
     start = param(1)
     grow = param(2)
     length = param(float("inf"))
@@ -79,6 +92,8 @@ class Dgeom(UGen):
 
 @ugen(dr=True)
 class Dibrown(UGen):
+    __slots__ = ()
+
     minimum = param(0)
     maximum = param(12)
     step = param(1)
@@ -87,6 +102,8 @@ class Dibrown(UGen):
 
 @ugen(dr=True)
 class Diwhite(UGen):
+    __slots__ = ()
+
     minimum = param(0)
     maximum = param(1)
     length = param(float("inf"))
@@ -94,30 +111,40 @@ class Diwhite(UGen):
 
 @ugen(dr=True)
 class Drand(UGen):
+    __slots__ = ()
+
     repeats = param(1)
     sequence = param(unexpanded=True)
 
 
 @ugen(dr=True)
 class Dreset(UGen):
+    __slots__ = ()
+
     source = param()
     reset = param(0)
 
 
 @ugen(dr=True)
 class Dseq(UGen):
+    __slots__ = ()
+
     repeats = param(1)
     sequence = param(unexpanded=True)
 
 
 @ugen(dr=True)
 class Dser(UGen):
+    __slots__ = ()
+
     repeats = param(1)
     sequence = param(unexpanded=True)
 
 
 @ugen(dr=True)
 class Dseries(UGen):
+    __slots__ = ()
+
     length = param(float("inf"))
     start = param(1)
     step = param(1)
@@ -125,30 +152,40 @@ class Dseries(UGen):
 
 @ugen(dr=True)
 class Dshuf(UGen):
+    __slots__ = ()
+
     repeats = param(1)
     sequence = param(unexpanded=True)
 
 
 @ugen(dr=True)
 class Dstutter(UGen):
+    __slots__ = ()
+
     n = param(2)
     source = param()
 
 
 @ugen(dr=True)
 class Dswitch(UGen):
+    __slots__ = ()
+
     index_ = param()
     sequence = param(unexpanded=True)
 
 
 @ugen(dr=True)
 class Dswitch1(UGen):
+    __slots__ = ()
+
     index_ = param()
     sequence = param(unexpanded=True)
 
 
 @ugen(dr=True)
 class Dunique(UGen):
+    __slots__ = ()
+
     source = param()
     max_buffer_size = param(1024)
     protected = param(True)
@@ -156,6 +193,8 @@ class Dunique(UGen):
 
 @ugen(ar=True, kr=True)
 class Duty(UGen):
+    __slots__ = ()
+
     duration = param(1.0)
     reset = param(0.0)
     level = param(1.0)
@@ -164,6 +203,8 @@ class Duty(UGen):
 
 @ugen(dr=True)
 class Dwhite(UGen):
+    __slots__ = ()
+
     minimum = param(0.0)
     maximum = param(0.0)
     length = param(float("inf"))
@@ -171,6 +212,8 @@ class Dwhite(UGen):
 
 @ugen(dr=True)
 class Dwrand(UGen):
+    __slots__ = ()
+
     repeats = param(1)
     length = param()
     weights = param(unexpanded=True)
@@ -184,24 +227,28 @@ class Dwrand(UGen):
         sequence: Sequence[UGenScalarInput],
         weights: Sequence[UGenScalarInput],
     ) -> UGenOperable:
-        if not isinstance(sequence, Sequence):
+        if not isinstance(sequence, (list, tuple, Sequence)):
             sequence = [sequence]
-        seq = tuple(float(x) for x in sequence)  # type: ignore[arg-type]
-        if not isinstance(weights, Sequence):
+        seq = tuple(map(float, sequence))  # type: ignore[arg-type]
+        if not isinstance(weights, (list, tuple, Sequence)):
             weights = [weights]
-        wts = tuple(float(x) for x in weights)  # type: ignore[arg-type]
-        wts = wts[: len(seq)]
-        wts += (0.0,) * (len(seq) - len(wts))
+        # One weight per sequence item: surplus weights are dropped (and never
+        # converted), missing ones are zero.
+        wts = [0.0] * len(seq)
+        count = min(len(seq), len(weights))
+        wts[:count] = map(float, weights[:count])  # type: ignore[arg-type]
         return cls._new_expanded(
             calculation_rate=CalculationRate.DEMAND,
             repeats=repeats,
             length=len(seq),
             sequence=seq,
-            weights=wts,
+            weights=tuple(wts),
         )
 
 
 @ugen(dr=True)
 class Dxrand(UGen):
+    __slots__ = ()
+
     repeats = param(1)
     sequence = param(unexpanded=True)
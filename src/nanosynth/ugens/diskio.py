@@ -5,18 +5,24 @@ from ..synthdef import UGen, param, ugen
 
 @ugen(ar=True, is_multichannel=True, has_done_flag=True)
 class DiskIn(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     loop = param(0)
 
 
 @ugen(ar=True, channel_count=0, fixed_channel_count=True)
 class DiskOut(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     source = param(unexpanded=True)
 
 
 @ugen(ar=True, is_multichannel=True, has_done_flag=True)
 class VDiskIn(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     rate = param(1)
     loop = param(0.0)
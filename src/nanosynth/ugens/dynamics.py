@@ -13,6 +13,8 @@ from ..synthdef import (
 
 @ugen(ar=True, kr=True)
 class Amplitude(UGen):
+    __slots__ = ()
+
     source = param()
     attack_time = param(0.01)
     release_time = param(0.01)
@@ -20,6 +22,8 @@ class Amplitude(UGen):
 
 @ugen(ar=True)
 class Compander(UGen):
+    __slots__ = ()
+
     source = param()
     control = param(0.0)
     threshold = param(0.5)
@@ -63,6 +67,8 @@ class CompanderD(PseudoUGen):
 
 @ugen(ar=True)
 class Limiter(UGen):
+    __slots__ = ()
+
     source = param()
     level = param(1.0)
     duration = param(0.01)
@@ -70,6 +76,8 @@ class Limiter(UGen):
 
 @ugen(ar=True)
 class Normalizer(UGen):
+    __slots__ = ()
+
     source = param()
     level = param(1.0)
     duration = param(0.01)
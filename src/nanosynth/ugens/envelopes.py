@@ -5,27 +5,37 @@ from ..synthdef import UGen, param, ugen
 
 @ugen(kr=True)
 class Done(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(kr=True)
 class Free(UGen):
+    __slots__ = ()
+
     trigger = param(0)
     node_id = param()
 
 
 @ugen(kr=True)
 class FreeSelf(UGen):
+    __slots__ = ()
+
     trigger = param()
 
 
 @ugen(kr=True)
 class FreeSelfWhenDone(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(kr=True, has_done_flag=True)
 class Linen(UGen):
+    __slots__ = ()
+
     gate = param(1.0)
     attack_time = param(0.01)
     sustain_level = param(1.0)
@@ -35,15 +45,21 @@ class Linen(UGen):
 
 @ugen(kr=True)
 class Pause(UGen):
+    __slots__ = ()
+
     trigger = param()
     node_id = param()
 
 
 @ugen(kr=True)
 class PauseSelf(UGen):
+    __slots__ = ()
+
     trigger = param()
 
 
 @ugen(kr=True)
 class PauseSelfWhenDone(UGen):
+    __slots__ = ()
+
     source = param()
@@ -1,6 +1,5 @@
 """Band-limited oscillator UGens."""
 
-import itertools
 from collections.abc import Sequence
 from typing import Any
 
@@ -17,24 +16,32 @@ from ..synthdef import (
 
 @ugen(ar=True, kr=True)
 class Blip(UGen):
+    __slots__ = ()
+
     frequency = param(440.0)
     harmonic_count = param(200.0)
 
 
 @ugen(ar=True, kr=True)
 class FSinOsc(UGen):
+    __slots__ = ()
+
     frequency = param(440.0)
     initial_phase = param(0.0)
 
 
 @ugen(ar=True, kr=True)
 class Pulse(UGen):
+    __slots__ = ()
+
     frequency = param(440.0)
     width = param(0.5)
 
 
 @ugen(ar=True)
 class Klank(UGen):
+    __slots__ = ()
+
     source = param()
     frequency_scale = param(1)
     frequency_offset = param(0)
@@ -59,13 +66,12 @@ class Klank(UGen):
             amplitudes = [1.0] * len(frequencies)
         if not decay_times:
             decay_times = [1.0] * len(frequencies)
-        max_len = max(len(frequencies), len(amplitudes), len(decay_times))
-        cycles = [itertools.cycle(s) for s in (frequencies, amplitudes, decay_times)]
-        specs: list[Any] = []
-        for i, (f, a, d) in enumerate(zip(*cycles)):
-            specs.extend([f, a, d])
-            if i >= max_len - 1:
-                break
+        # Interleave (frequency, amplitude, decay) triples, cycling the
+        # shorter lists, by filling each stride of a preallocated list.
+        count = max(len(frequencies), len(amplitudes), len(decay_times))
+        specs: list[Any] = [None] * (count * 3)
+        for offset, values in enumerate((frequencies, amplitudes, decay_times)):
+            specs[offset::3] = (list(values) * -(-count // len(values)))[:count]
         return cls._new_expanded(
             calculation_rate=CalculationRate.AUDIO,
             decay_scale=decay_scale,
@@ -78,4 +84,6 @@ class Klank(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Saw(UGen):
+    __slots__ = ()
+
     frequency = param(440.0)
@@ -5,6 +5,8 @@ from ..synthdef import PseudoUGen, UGen, UGenOperable, UGenRecursiveInput, param
 
 @ugen(ar=True, kr=True, is_pure=True)
 class APF(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(440.0)
     radius = param(0.8)
@@ -34,6 +36,8 @@ class Changed(PseudoUGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class BPF(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(440.0)
     reciprocal_of_q = param(1.0)
@@ -41,11 +45,15 @@ class BPF(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class BPZ2(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class BRF(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(440.0)
     reciprocal_of_q = param(1.0)
@@ -53,17 +61,23 @@ class BRF(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class BRZ2(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Decay(UGen):
+    __slots__ = ()
+
     source = param()
     decay_time = param(1.0)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Decay2(UGen):
+    __slots__ = ()
+
     source = param()
     attack_time = param(0.01)
     decay_time = param(1.0)
@@ -71,6 +85,8 @@ class Decay2(UGen):
 
 @ugen(ar=True, kr=True)
 class DetectSilence(UGen):
+    __slots__ = ()
+
     source = param()
     threshold = param(0.0001)
     time = param(0.1)
@@ -79,6 +95,8 @@ class DetectSilence(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class FOS(UGen):
+    __slots__ = ()
+
     source = param()
     a_0 = param(0.0)
     a_1 = param(0.0)
@@ -87,6 +105,8 @@ class FOS(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Formlet(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(440.0)
     attack_time = param(1.0)
@@ -95,34 +115,46 @@ class Formlet(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class HPF(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(440.0)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class HPZ1(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class HPZ2(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Integrator(UGen):
+    __slots__ = ()
+
     source = param()
     coefficient = param(1.0)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Lag(UGen):
+    __slots__ = ()
+
     source = param()
     lag_time = param(0.1)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class LagUD(UGen):
+    __slots__ = ()
+
     source = param()
     lag_time_up = param(0.1)
     lag_time_down = param(0.1)
@@ -130,12 +162,16 @@ class LagUD(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Lag2(UGen):
+    __slots__ = ()
+
     source = param()
     lag_time = param(0.1)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Lag2UD(UGen):
+    __slots__ = ()
+
     source = param()
     lag_time_up = param(0.1)
     lag_time_down = param(0.1)
@@ -143,12 +179,16 @@ class Lag2UD(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Lag3(UGen):
+    __slots__ = ()
+
     source = param()
     lag_time = param(0.1)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Lag3UD(UGen):
+    __slots__ = ()
+
     source = param()
     lag_time_up = param(0.1)
     lag_time_down = param(0.1)
@@ -156,34 +196,46 @@ class Lag3UD(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class LeakDC(UGen):
+    __slots__ = ()
+
     source = param()
     coefficient = param(0.995)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class LPF(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(440.0)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class LPZ1(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class LPZ2(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Median(UGen):
+    __slots__ = ()
+
     length = param(3)
     source = param()
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class MidEQ(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(440.0)
     reciprocal_of_q = param(1.0)
@@ -192,6 +244,8 @@ class MidEQ(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class MoogFF(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(100.0)
     gain = param(2.0)
@@ -200,18 +254,24 @@ class MoogFF(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class OnePole(UGen):
+    __slots__ = ()
+
     source = param()
     coefficient = param(0.5)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class OneZero(UGen):
+    __slots__ = ()
+
     source = param()
     coefficient = param(0.5)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class RHPF(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(440.0)
     reciprocal_of_q = param(1.0)
@@ -219,6 +279,8 @@ class RHPF(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class RLPF(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(440.0)
     reciprocal_of_q = param(1.0)
@@ -226,12 +288,16 @@ class RLPF(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Ramp(UGen):
+    __slots__ = ()
+
     source = param()
     lag_time = param(0.1)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Ringz(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(440.0)
     decay_time = param(1.0)
@@ -239,6 +305,8 @@ class Ringz(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class SOS(UGen):
+    __slots__ = ()
+
     source = param()
     a_0 = param(0.0)
     a_1 = param(0.0)
@@ -249,6 +317,8 @@ class SOS(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Slew(UGen):
+    __slots__ = ()
+
     source = param()
     up = param(1.0)
     down = param(1.0)
@@ -256,11 +326,15 @@ class Slew(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Slope(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class TwoPole(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(440.0)
     radius = param(0.8)
@@ -268,6 +342,8 @@ class TwoPole(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class TwoZero(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(440.0)
     radius = param(0.8)
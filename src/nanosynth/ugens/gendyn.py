@@ -24,12 +24,31 @@ from ..synthdef import (
 )
 
 
+class _Gendy(UGen):
+    """Shared base: ``knum`` defaults to ``init_cps`` when left unset."""
+
+    __slots__ = ()
+
+    def _postprocess_kwargs(
+        self,
+        *,
+        calculation_rate: CalculationRate,
+        **kwargs: UGenRecursiveInput | None,
+    ) -> tuple[CalculationRate, dict[str, Any]]:
+        knum: Any = kwargs.get("knum")
+        if type(knum) is Default:
+            kwargs["knum"] = kwargs.get("init_cps")
+        return calculation_rate, kwargs
+
+
 @ugen(ar=True, kr=True)
-class Gendy1(UGen):
+class Gendy1(_Gendy):
     """Gendy1 -- ZIN0 order: whichamp(0), whichdur(1), adparam(2),
     ddparam(3), minfreq(4), maxfreq(5), ampscale(6), durscale(7),
     initCPs(8), knum(9)."""
 
+    __slots__ = ()
+
     amplitude_distribution = param(1)
     duration_distribution = param(1)
     amplitude_parameter = param(1.0)
@@ -41,23 +60,15 @@ class Gendy1(UGen):
     init_cps = param(12)
     knum = param(Default())
 
-    def _postprocess_kwargs(
-        self,
-        *,
-        calculation_rate: CalculationRate,
-        **kwargs: UGenRecursiveInput | None,
-    ) -> tuple[CalculationRate, dict[str, Any]]:
-        if isinstance(kwargs.get("knum"), Default):
-            kwargs["knum"] = kwargs.get("init_cps")
-        return calculation_rate, kwargs
-
 
 @ugen(ar=True, kr=True)
-class Gendy2(UGen):
+class Gendy2(_Gendy):
     """Gendy2 -- ZIN0 order: whichamp(0), whichdur(1), adparam(2),
     ddparam(3), minfreq(4), maxfreq(5), ampscale(6), durscale(7),
     initCPs(8), knum(9), a(10), c(11)."""
 
+    __slots__ = ()
+
     amplitude_distribution = param(1)
     duration_distribution = param(1)
     amplitude_parameter = param(1.0)
@@ -71,19 +82,9 @@ class Gendy2(UGen):
     a = param(1.17)
     c = param(0.31)
 
-    def _postprocess_kwargs(
-        self,
-        *,
-        calculation_rate: CalculationRate,
-        **kwargs: UGenRecursiveInput | None,
-    ) -> tuple[CalculationRate, dict[str, Any]]:
-        if isinstance(kwargs.get("knum"), Default):
-            kwargs["knum"] = kwargs.get("init_cps")
-        return calculation_rate, kwargs
-
 
 @ugen(ar=True, kr=True)
-class Gendy3(UGen):
+class Gendy3(_Gendy):
     """Gendy3 -- ZIN0 order: whichamp(0), whichdur(1), adparam(2),
     ddparam(3), freq(4), ampscale(5), durscale(6), initCPs(7), knum(8).
 
@@ -91,6 +92,8 @@ class Gendy3(UGen):
     initCPs from ZIN0(7) and knum from ZIN0(8).
     """
 
+    __slots__ = ()
+
     amplitude_distribution = param(1)
     duration_distribution = param(1)
     amplitude_parameter = param(1.0)
@@ -100,13 +103,3 @@ class Gendy3(UGen):
     duration_scale = param(0.5)
     init_cps = param(12)
     knum = param(Default())
-
-    def _postprocess_kwargs(
-        self,
-        *,
-        calculation_rate: CalculationRate,
-        **kwargs: UGenRecursiveInput | None,
-    ) -> tuple[CalculationRate, dict[str, Any]]:
-        if isinstance(kwargs.get("knum"), Default):
-            kwargs["knum"] = kwargs.get("init_cps")
-        return calculation_rate, kwargs
@@ -5,6 +5,8 @@ from ..synthdef import UGen, param, ugen
 
 @ugen(ar=True, is_multichannel=True)
 class GrainBuf(UGen):
+    __slots__ = ()
+
     trigger = param(0)
     duration = param(1)
     buffer_id = param()
@@ -18,6 +20,8 @@ class GrainBuf(UGen):
 
 @ugen(ar=True, is_multichannel=True)
 class GrainIn(UGen):
+    __slots__ = ()
+
     trigger = param(0)
     duration = param(1)
     source = param()
@@ -28,6 +32,8 @@ class GrainIn(UGen):
 
 @ugen(ar=True)
 class PitchShift(UGen):
+    __slots__ = ()
+
     source = param()
     window_size = param(0.2)
     pitch_ratio = param(1.0)
@@ -37,6 +43,8 @@ class PitchShift(UGen):
 
 @ugen(ar=True, is_multichannel=True)
 class Warp1(UGen):
+    __slots__ = ()
+
     buffer_id = param(0)
     pointer = param(0)
     frequency_scaling = param(1)
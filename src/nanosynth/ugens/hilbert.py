@@ -5,6 +5,8 @@ from ..synthdef import UGen, param, ugen
 
 @ugen(ar=True)
 class FreqShift(UGen):
+    __slots__ = ()
+
     source = param()
     frequency = param(0.0)
     phase = param(0.0)
@@ -12,10 +14,14 @@ class FreqShift(UGen):
 
 @ugen(ar=True, channel_count=2, fixed_channel_count=True)
 class Hilbert(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(ar=True)
 class HilbertFIR(UGen):
+    __slots__ = ()
+
     source = param()
     buffer_id = param()
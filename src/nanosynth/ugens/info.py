@@ -5,99 +5,111 @@ from ..synthdef import UGen, param, ugen
 
 @ugen(ir=True)
 class BlockSize(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(kr=True, ir=True)
 class BufChannels(UGen):
+    __slots__ = ()
+
     buffer_id = param()
 
 
 @ugen(kr=True, ir=True)
 class BufDur(UGen):
+    __slots__ = ()
+
     buffer_id = param()
 
 
 @ugen(kr=True, ir=True)
 class BufFrames(UGen):
+    __slots__ = ()
+
     buffer_id = param()
 
 
 @ugen(kr=True, ir=True)
 class BufRateScale(UGen):
+    __slots__ = ()
+
     buffer_id = param()
 
 
 @ugen(kr=True, ir=True)
 class BufSampleRate(UGen):
+    __slots__ = ()
+
     buffer_id = param()
 
 
 @ugen(kr=True, ir=True)
 class BufSamples(UGen):
+    __slots__ = ()
+
     buffer_id = param()
 
 
 @ugen(ir=True)
 class ControlDur(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(ir=True)
 class ControlRate(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(ir=True)
 class NodeID(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(ir=True)
 class NumAudioBuses(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(ir=True)
 class NumBuffers(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(ir=True)
 class NumControlBuses(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(ir=True)
 class NumInputBuses(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(ir=True)
 class NumOutputBuses(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(kr=True, ir=True)
 class NumRunningSynths(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(ir=True)
 class RadiansPerSample(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(ir=True)
 class SampleDur(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(ir=True)
 class SampleRate(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(ir=True)
 class SubsampleOffset(UGen):
-    pass
+    __slots__ = ()
@@ -1,25 +1,29 @@
 """Bus input/output UGens."""
 
-import itertools
-from collections.abc import Sequence
 from typing import Any
 
 from ..enums import CalculationRate
-from ..synthdef import UGen, UGenRecursiveInput, param, ugen
+from ..synthdef import UGen, UGenRecursiveInput, UGenVector, param, ugen
 
 
 @ugen(ar=True, kr=True, is_multichannel=True)
 class In(UGen):
+    __slots__ = ()
+
     bus = param(0.0)
 
 
 @ugen(ar=True, kr=True, is_multichannel=True)
 class InFeedback(UGen):
+    __slots__ = ()
+
     bus = param(0.0)
 
 
 @ugen(ar=True, kr=True, is_multichannel=True)
 class LocalIn(UGen):
+    __slots__ = ()
+
     default = param(0.0, unexpanded=True)
 
     def _postprocess_kwargs(
@@ -29,45 +33,53 @@ class LocalIn(UGen):
         **kwargs: UGenRecursiveInput | None,
     ) -> tuple[CalculationRate, dict[str, Any]]:
         default = kwargs["default"]
-        if not isinstance(default, Sequence):
+        if not isinstance(default, (list, tuple, UGenVector)):
             default = [default]  # type: ignore[list-item]
         defaults = [float(x) for x in default]  # type: ignore[arg-type]
         # Repeat defaults to fill channel_count
         result: list[float] = []
-        cycle = itertools.cycle(defaults)
-        for i, x in enumerate(cycle):
-            if i >= self._channel_count:
-                break
-            result.append(x)
+        if defaults:
+            count = self._channel_count
+            result = (defaults * -(-count // len(defaults)))[:count]
         kwargs["default"] = result
         return calculation_rate, kwargs
 
 
 @ugen(ar=True, kr=True, channel_count=0, fixed_channel_count=True)
 class LocalOut(UGen):
+    __slots__ = ()
+
     source = param(unexpanded=True)
 
 
 @ugen(ar=True, kr=True, is_output=True, channel_count=0, fixed_channel_count=True)
 class OffsetOut(UGen):
+    __slots__ = ()
+
     bus = param(0)
     source = param(unexpanded=True)
 
 
 @ugen(ar=True, kr=True, is_output=True, channel_count=0, fixed_channel_count=True)
 class Out(UGen):
+    __slots__ = ()
+
     bus = param(0)
     source = param(unexpanded=True)
 
 
 @ugen(ar=True, kr=True, is_output=True, channel_count=0, fixed_channel_count=True)
 class ReplaceOut(UGen):
+    __slots__ = ()
+
     bus = param(0)
     source = param(unexpanded=True)
 
 
 @ugen(ar=True, kr=True, is_output=True, channel_count=0, fixed_channel_count=True)
 class XOut(UGen):
+    __slots__ = ()
+
     bus = param(0)
     crossfade = param(0.0)
     source = param(unexpanded=True)
@@ -13,11 +13,15 @@ from ..synthdef import (
 
 @ugen(kr=True, is_pure=True)
 class A2K(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(ar=True, ir=True, kr=True, is_pure=True)
 class AmpComp(UGen):
+    __slots__ = ()
+
     frequency = param(1000.0)
     root = param(0.0)
     exp = param(0.3333)
@@ -25,6 +29,8 @@ class AmpComp(UGen):
 
 @ugen(ar=True, ir=True, kr=True, is_pure=True)
 class AmpCompA(UGen):
+    __slots__ = ()
+
     frequency = param(1000.0)
     root = param(0.0)
     min_amp = param(0.32)
@@ -33,16 +39,22 @@ class AmpCompA(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class DC(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(ar=True, is_pure=True)
 class K2A(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class LinExp(UGen):
+    __slots__ = ()
+
     source = param()
     input_minimum = param(0)
     input_maximum = param(1)
@@ -68,24 +80,14 @@ class LinLin(PseudoUGen):
         offset = output_minimum - (scale * input_minimum)
         return MulAdd.new(source=source, multiplier=scale, addend=offset)  # type: ignore[attr-defined,no-any-return]
 
-    @staticmethod
-    def kr(
-        *,
-        source: UGenRecursiveInput,
-        input_minimum: UGenRecursiveInput = 0.0,
-        input_maximum: UGenRecursiveInput = 1.0,
-        output_minimum: UGenRecursiveInput = 1.0,
-        output_maximum: UGenRecursiveInput = 2.0,
-    ) -> UGenOperable:
-        from .basic import MulAdd
-
-        scale = (output_maximum - output_minimum) / (input_maximum - input_minimum)  # type: ignore[operator]
-        offset = output_minimum - (scale * input_minimum)
-        return MulAdd.new(source=source, multiplier=scale, addend=offset)  # type: ignore[attr-defined,no-any-return]
+    # Rate follows the source, so both constructors share one body.
+    kr = ar
 
 
 @ugen(ar=True, kr=True, has_done_flag=True)
 class Line(UGen):
+    __slots__ = ()
+
     start = param(0.0)
     stop = param(1.0)
     duration = param(1.0)
@@ -105,6 +107,8 @@ class Silence(PseudoUGen):
 
 @ugen(ar=True, kr=True, has_done_flag=True)
 class XLine(UGen):
+    __slots__ = ()
+
     start = param(1.0)
     stop = param(2.0)
     duration = param(1.0)
@@ -5,6 +5,8 @@ from ..synthdef import UGen, param, ugen
 
 @ugen(kr=True)
 class KeyState(UGen):
+    __slots__ = ()
+
     keycode = param(0)
     minimum = param(0.0)
     maximum = param(1.0)
@@ -13,6 +15,8 @@ class KeyState(UGen):
 
 @ugen(kr=True)
 class MouseButton(UGen):
+    __slots__ = ()
+
     minimum = param(0.0)
     maximum = param(1.0)
     lag = param(0.2)
@@ -20,6 +24,8 @@ class MouseButton(UGen):
 
 @ugen(kr=True)
 class MouseX(UGen):
+    __slots__ = ()
+
     minimum = param(0.0)
     maximum = param(1.0)
     warp = param(0)
@@ -28,6 +34,8 @@ class MouseX(UGen):
 
 @ugen(kr=True)
 class MouseY(UGen):
+    __slots__ = ()
+
     minimum = param(0.0)
     maximum = param(1.0)
     warp = param(0)
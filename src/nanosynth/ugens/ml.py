@@ -8,12 +8,16 @@ from ..synthdef import UGen, UGenRecursiveInput, param, ugen
 
 @ugen(kr=True, channel_count=4, fixed_channel_count=True)
 class BeatTrack(UGen):
+    __slots__ = ()
+
     pv_chain = param()
     lock = param(0.0)
 
 
 @ugen(kr=True, channel_count=6, fixed_channel_count=True)
 class BeatTrack2(UGen):
+    __slots__ = ()
+
     bus_index = param(0.0)
     feature_count = param()
     window_size = param(2)
@@ -24,6 +28,8 @@ class BeatTrack2(UGen):
 
 @ugen(kr=True)
 class KeyTrack(UGen):
+    __slots__ = ()
+
     pv_chain = param()
     key_decay = param(2)
     chroma_leak = param(0.5)
@@ -31,6 +37,8 @@ class KeyTrack(UGen):
 
 @ugen(kr=True)
 class Loudness(UGen):
+    __slots__ = ()
+
     pv_chain = param()
     smask = param(0.25)
     tmask = param(1)
@@ -38,6 +46,8 @@ class Loudness(UGen):
 
 @ugen(kr=True, fixed_channel_count=True)
 class MFCC(UGen):
+    __slots__ = ()
+
     pv_chain = param()
     coeff_count = param(13)
 
@@ -53,6 +63,8 @@ class MFCC(UGen):
 
 @ugen(kr=True)
 class Onsets(UGen):
+    __slots__ = ()
+
     pv_chain = param()
     threshold = param(0.5)
     odftype = param(3)
@@ -66,6 +78,8 @@ class Onsets(UGen):
 
 @ugen(kr=True, channel_count=2, fixed_channel_count=True)
 class Pitch(UGen):
+    __slots__ = ()
+
     source = param()
     initial_frequency = param(440)
     min_frequency = param(60)
@@ -81,16 +95,22 @@ class Pitch(UGen):
 
 @ugen(kr=True)
 class SpecCentroid(UGen):
+    __slots__ = ()
+
     pv_chain = param()
 
 
 @ugen(kr=True)
 class SpecFlatness(UGen):
+    __slots__ = ()
+
     pv_chain = param()
 
 
 @ugen(kr=True)
 class SpecPcile(UGen):
+    __slots__ = ()
+
     pv_chain = param()
     fraction = param(0.5)
     interpolate = param(0)
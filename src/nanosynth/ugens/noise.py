@@ -5,99 +5,131 @@ from ..synthdef import UGen, param, ugen
 
 @ugen(ar=True, kr=True)
 class BrownNoise(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(ar=True, kr=True)
 class ClipNoise(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(ar=True, kr=True)
 class CoinGate(UGen):
+    __slots__ = ()
+
     probability = param(0.5)
     trigger = param()
 
 
 @ugen(ar=True, kr=True)
 class Crackle(UGen):
+    __slots__ = ()
+
     chaos_parameter = param(1.5)
 
 
 @ugen(ar=True, kr=True)
 class Dust(UGen):
+    __slots__ = ()
+
     density = param(0.0)
 
 
 @ugen(ar=True, kr=True)
 class Dust2(UGen):
+    __slots__ = ()
+
     density = param(0.0)
 
 
 @ugen(ir=True)
 class ExpRand(UGen):
+    __slots__ = ()
+
     minimum = param(0.0)
     maximum = param(1.0)
 
 
 @ugen(ar=True, kr=True)
 class GrayNoise(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(ar=True, kr=True)
 class Hasher(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(ir=True)
 class IRand(UGen):
+    __slots__ = ()
+
     minimum = param(0)
     maximum = param(127)
 
 
 @ugen(ar=True, kr=True)
 class LFClipNoise(UGen):
+    __slots__ = ()
+
     frequency = param(500.0)
 
 
 @ugen(ar=True, kr=True)
 class LFDClipNoise(UGen):
+    __slots__ = ()
+
     frequency = param(500.0)
 
 
 @ugen(ar=True, kr=True)
 class LFDNoise0(UGen):
+    __slots__ = ()
+
     frequency = param(500.0)
 
 
 @ugen(ar=True, kr=True)
 class LFDNoise1(UGen):
+    __slots__ = ()
+
     frequency = param(500.0)
 
 
 @ugen(ar=True, kr=True)
 class LFDNoise3(UGen):
+    __slots__ = ()
+
     frequency = param(500.0)
 
 
 @ugen(ar=True, kr=True)
 class LFNoise0(UGen):
+    __slots__ = ()
+
     frequency = param(500.0)
 
 
 @ugen(ar=True, kr=True)
 class LFNoise1(UGen):
+    __slots__ = ()
+
     frequency = param(500.0)
 
 
 @ugen(ar=True, kr=True)
 class LFNoise2(UGen):
+    __slots__ = ()
+
     frequency = param(500.0)
 
 
 @ugen(ir=True)
 class LinRand(UGen):
+    __slots__ = ()
+
     minimum = param(0.0)
     maximum = param(1.0)
     skew = param(0)
@@ -105,6 +137,8 @@ class LinRand(UGen):
 
 @ugen(ar=True, kr=True)
 class Logistic(UGen):
+    __slots__ = ()
+
     chaos_parameter = param(3)
     frequency = param(1000)
     initial_y = param(0.5)
@@ -112,12 +146,16 @@ class Logistic(UGen):
 
 @ugen(ar=True, kr=True)
 class MantissaMask(UGen):
+    __slots__ = ()
+
     source = param(0)
     bits = param(3)
 
 
 @ugen(ir=True)
 class NRand(UGen):
+    __slots__ = ()
+
     minimum = param(0.0)
     maximum = param(1.0)
     n = param(1)
@@ -125,28 +163,36 @@ class NRand(UGen):
 
 @ugen(ar=True, kr=True)
 class PinkNoise(UGen):
-    pass
+    __slots__ = ()
 
 
 @ugen(ir=True)
 class Rand(UGen):
+    __slots__ = ()
+
     minimum = param(0.0)
     maximum = param(1.0)
 
 
 @ugen(kr=True, ir=True, is_width_first=True)
 class RandID(UGen):
+    __slots__ = ()
+
     rand_id = param(1)
 
 
 @ugen(ar=True, kr=True, ir=True, is_width_first=True)
 class RandSeed(UGen):
+    __slots__ = ()
+
     trigger = param(0)
     seed = param(56789)
 
 
 @ugen(ar=True, kr=True)
 class TExpRand(UGen):
+    __slots__ = ()
+
     minimum = param(0.01)
     maximum = param(1.0)
     trigger = param(0)
@@ -154,6 +200,8 @@ class TExpRand(UGen):
 
 @ugen(ar=True, kr=True)
 class TIRand(UGen):
+    __slots__ = ()
+
     minimum = param(0)
     maximum = param(127)
     trigger = param(0)
@@ -161,6 +209,8 @@ class TIRand(UGen):
 
 @ugen(ar=True, kr=True)
 class TRand(UGen):
+    __slots__ = ()
+
     minimum = param(0.0)
     maximum = param(1.0)
     trigger = param(0)
@@ -168,6 +218,8 @@ class TRand(UGen):
 
 @ugen(ar=True, kr=True)
 class TWindex(UGen):
+    __slots__ = ()
+
     trigger = param()
     normalize = param(0)
     array = param(unexpanded=True)
@@ -175,4 +227,4 @@ class TWindex(UGen):
 
 @ugen(ar=True, kr=True)
 class WhiteNoise(UGen):
-    pass
+    __slots__ = ()
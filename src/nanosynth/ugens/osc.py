@@ -5,6 +5,8 @@ from ..synthdef import UGen, param, ugen
 
 @ugen(ar=True, kr=True, is_pure=True)
 class COsc(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     frequency = param(440.0)
     beats = param(0.5)
@@ -12,6 +14,8 @@ class COsc(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class DegreeToKey(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     source = param()
     octave = param(12)
@@ -19,24 +23,32 @@ class DegreeToKey(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Impulse(UGen):
+    __slots__ = ()
+
     frequency = param(440.0)
     phase = param(0.0)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Index(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     source = param()
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class LFCub(UGen):
+    __slots__ = ()
+
     frequency = param(440.0)
     initial_phase = param(0.0)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class LFGauss(UGen):
+    __slots__ = ()
+
     duration = param(1)
     width = param(0.1)
     initial_phase = param(0)
@@ -46,12 +58,16 @@ class LFGauss(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class LFPar(UGen):
+    __slots__ = ()
+
     frequency = param(440.0)
     initial_phase = param(0.0)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class LFPulse(UGen):
+    __slots__ = ()
+
     frequency = param(440.0)
     initial_phase = param(0.0)
     width = param(0.5)
@@ -59,18 +75,24 @@ class LFPulse(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class LFSaw(UGen):
+    __slots__ = ()
+
     frequency = param(440.0)
     initial_phase = param(0.0)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class LFTri(UGen):
+    __slots__ = ()
+
     frequency = param(440.0)
     initial_phase = param(0.0)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Osc(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     frequency = param(440.0)
     initial_phase = param(0.0)
@@ -78,6 +100,8 @@ class Osc(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class OscN(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     frequency = param(440.0)
     initial_phase = param(0.0)
@@ -85,24 +109,32 @@ class OscN(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Select(UGen):
+    __slots__ = ()
+
     selector = param()
     sources = param(unexpanded=True)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class SinOsc(UGen):
+    __slots__ = ()
+
     frequency = param(440.0)
     phase = param(0.0)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class SyncSaw(UGen):
+    __slots__ = ()
+
     sync_frequency = param(440.0)
     saw_frequency = param(440.0)
 
 
 @ugen(ar=True, kr=True, is_pure=True)
 class VOsc(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     frequency = param(440.0)
     phase = param(0.0)
@@ -110,6 +142,8 @@ class VOsc(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class VOsc3(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     freq_1 = param(110.0)
     freq_2 = param(220.0)
@@ -118,6 +152,8 @@ class VOsc3(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class VarSaw(UGen):
+    __slots__ = ()
+
     frequency = param(440.0)
     initial_phase = param(0.0)
     width = param(0.5)
@@ -125,6 +161,8 @@ class VarSaw(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class Vibrato(UGen):
+    __slots__ = ()
+
     frequency = param(440)
     rate = param(6)
     depth = param(0.02)
@@ -137,5 +175,7 @@ class Vibrato(UGen):
 
 @ugen(ar=True, kr=True, is_pure=True)
 class WrapIndex(UGen):
+    __slots__ = ()
+
     buffer_id = param()
     source = param()
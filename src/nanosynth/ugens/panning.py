@@ -18,6 +18,8 @@ from ..synthdef import (
 
 @ugen(ar=True, kr=True, channel_count=2, fixed_channel_count=True)
 class Balance2(UGen):
+    __slots__ = ()
+
     left = param()
     right = param()
     position = param(0.0)
@@ -26,6 +28,8 @@ class Balance2(UGen):
 
 @ugen(ar=True, kr=True, channel_count=3, fixed_channel_count=True)
 class BiPanB2(UGen):
+    __slots__ = ()
+
     in_a = param()
     in_b = param()
     azimuth = param()
@@ -34,6 +38,8 @@ class BiPanB2(UGen):
 
 @ugen(ar=True, kr=True, is_multichannel=True, channel_count=4)
 class DecodeB2(UGen):
+    __slots__ = ()
+
     w = param()
     x = param()
     y = param()
@@ -42,6 +48,8 @@ class DecodeB2(UGen):
 
 @ugen(ar=True, kr=True, channel_count=2, fixed_channel_count=True)
 class Pan2(UGen):
+    __slots__ = ()
+
     source = param()
     position = param(0.0)
     level = param(1.0)
@@ -49,6 +57,8 @@ class Pan2(UGen):
 
 @ugen(ar=True, kr=True, channel_count=4, fixed_channel_count=True)
 class Pan4(UGen):
+    __slots__ = ()
+
     source = param()
     x_position = param(0)
     y_position = param(0)
@@ -57,6 +67,8 @@ class Pan4(UGen):
 
 @ugen(ar=True, kr=True, is_multichannel=True)
 class PanAz(UGen):
+    __slots__ = ()
+
     source = param()
     position = param(0)
     amplitude = param(1)
@@ -66,6 +78,8 @@ class PanAz(UGen):
 
 @ugen(ar=True, kr=True, channel_count=3, fixed_channel_count=True)
 class PanB(UGen):
+    __slots__ = ()
+
     source = param()
     azimuth = param(0)
     elevation = param(0)
@@ -74,6 +88,8 @@ class PanB(UGen):
 
 @ugen(ar=True, kr=True, channel_count=3, fixed_channel_count=True)
 class PanB2(UGen):
+    __slots__ = ()
+
     source = param()
     azimuth = param(0)
     gain = param(1)
@@ -81,6 +97,8 @@ class PanB2(UGen):
 
 @ugen(ar=True, kr=True, channel_count=2, fixed_channel_count=True)
 class Rotate2(UGen):
+    __slots__ = ()
+
     x = param()
     y = param()
     position = param(0)
@@ -90,7 +108,7 @@ class Splay(PseudoUGen):
     """Stereo signal spreader."""
 
     _ordered_keys = ("spread", "level", "center", "normalize", "source")
-    _unexpanded_keys = ("source",)
+    _unexpanded_keys = frozenset(["source"])
 
     @classmethod
     def _new_expanded(
@@ -111,14 +129,10 @@ class Splay(PseudoUGen):
                     calculation_rate=calculation_rate,
                     **all_expanded_params,  # type: ignore[arg-type]
                 )
-            return UGenVector(*(recurse(ep) for ep in all_expanded_params))
+            return UGenVector._from_operables(recurse(ep) for ep in all_expanded_params)
 
         return Mix.multichannel(
-            recurse(
-                UGen._expand_params(
-                    kwargs, unexpanded_keys=frozenset(cls._unexpanded_keys)
-                )
-            ),
+            recurse(UGen._expand_params(kwargs, unexpanded_keys=cls._unexpanded_keys)),
             2,
         )
 
@@ -134,18 +148,29 @@ class Splay(PseudoUGen):
         spread: UGenRecursiveInput = 1,
         **kwargs: UGenRecursiveInput,
     ) -> UGenOperable:
-        from .basic import Mix
+        from .basic import Mix, MulAdd
 
-        if not isinstance(source, Sequence):
+        # Concrete types first: isinstance() stops at the first match, so
+        # lists and tuples never reach the slower ABC check.
+        if not isinstance(source, (list, tuple, Sequence)):
             source = [source]
         n = len(source)
         if n == 1:
             positions: list[UGenRecursiveInput] = [center]
-        else:
+        elif isinstance(spread, (int, float)):
             positions = [
                 (i * (2 / (n - 1)) - 1) * spread + center  # type: ignore[operator]
                 for i in range(n)
             ]
+        else:
+            # A graph-valued spread costs one MulAdd per channel rather
+            # than a separate multiply and add.
+            positions = [
+                MulAdd.new(  # type: ignore[attr-defined]
+                    source=spread, multiplier=i * (2 / (n - 1)) - 1, addend=center
+                )
+                for i in range(n)
+            ]
         if normalize:
             if calculation_rate == CalculationRate.AUDIO:
                 level = level * math.sqrt(1 / n)  # type: ignore[operator]
@@ -198,6 +223,8 @@ class Splay(PseudoUGen):
 
 @ugen(ar=True, kr=True)
 class XFade2(UGen):
+    __slots__ = ()
+
     in_a = param()
     in_b = param(0)
     pan = param(0)
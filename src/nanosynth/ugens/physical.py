@@ -5,6 +5,8 @@ from ..synthdef import UGen, param, ugen
 
 @ugen(ar=True, kr=True)
 class Ball(UGen):
+    __slots__ = ()
+
     source = param()
     gravity = param(1.0)
     damping = param(0.0)
@@ -13,6 +15,8 @@ class Ball(UGen):
 
 @ugen(ar=True)
 class Pluck(UGen):
+    __slots__ = ()
+
     source = param()
     trigger = param()
     maximum_delay_time = param(0.2)
@@ -23,6 +27,8 @@ class Pluck(UGen):
 
 @ugen(ar=True, kr=True)
 class Spring(UGen):
+    __slots__ = ()
+
     source = param()
     spring = param(1.0)
     damping = param(0.0)
@@ -30,6 +36,8 @@ class Spring(UGen):
 
 @ugen(ar=True, kr=True)
 class TBall(UGen):
+    __slots__ = ()
+
     source = param()
     gravity = param(10.0)
     damping = param(0.0)
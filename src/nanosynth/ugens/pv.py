@@ -17,6 +17,8 @@ from ..synthdef import (
 class PV_ChainUGen(UGen):
     """Abstract base class for phase-vocoder-chain unit generators."""
 
+    __slots__ = ()
+
     @property
     def fft_size(self) -> UGenOperable:
         input_ = self.inputs[0]
@@ -29,6 +31,8 @@ class PV_ChainUGen(UGen):
 
 @ugen(kr=True, is_width_first=True)
 class FFT(PV_ChainUGen):
+    __slots__ = ()
+
     buffer_id = param(Default())
     source = param()
     hop = param(0.5)
@@ -59,6 +63,8 @@ class FFT(PV_ChainUGen):
 
 @ugen(ar=True, kr=True, is_width_first=True)
 class IFFT(UGen):
+    __slots__ = ()
+
     pv_chain = param()
     window_type = param(0)
     window_size = param(0)
@@ -66,12 +72,16 @@ class IFFT(UGen):
 
 @ugen(kr=True, is_width_first=True)
 class PV_Add(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain_a = param()
     pv_chain_b = param()
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_BinScramble(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     wipe = param(0)
     width = param(0.2)
@@ -80,6 +90,8 @@ class PV_BinScramble(PV_ChainUGen):
 
 @ugen(kr=True, is_width_first=True)
 class PV_BinShift(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     stretch = param(1.0)
     shift = param(0.0)
@@ -88,6 +100,8 @@ class PV_BinShift(PV_ChainUGen):
 
 @ugen(kr=True, is_width_first=True)
 class PV_BinWipe(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain_a = param()
     pv_chain_b = param()
     wipe = param(0)
@@ -95,12 +109,16 @@ class PV_BinWipe(PV_ChainUGen):
 
 @ugen(kr=True, is_width_first=True)
 class PV_BrickWall(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     wipe = param(0)
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_ConformalMap(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     areal = param(0)
     aimag = param(0)
@@ -108,35 +126,47 @@ class PV_ConformalMap(PV_ChainUGen):
 
 @ugen(kr=True, is_width_first=True)
 class PV_Conj(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_Copy(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain_a = param()
     pv_chain_b = param()
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_CopyPhase(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain_a = param()
     pv_chain_b = param()
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_Diffuser(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     trigger = param(0)
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_Div(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain_a = param()
     pv_chain_b = param()
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_HainsworthFoote(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     proph = param(0)
     propf = param(0)
@@ -146,6 +176,8 @@ class PV_HainsworthFoote(PV_ChainUGen):
 
 @ugen(kr=True, is_width_first=True)
 class PV_JensenAndersen(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     propsc = param(0.25)
     prophfe = param(0.25)
@@ -157,30 +189,40 @@ class PV_JensenAndersen(PV_ChainUGen):
 
 @ugen(kr=True, is_width_first=True)
 class PV_LocalMax(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     threshold = param(0)
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_MagAbove(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     threshold = param(0)
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_MagBelow(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     threshold = param(0)
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_MagClip(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     threshold = param(0)
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_MagDiv(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain_a = param()
     pv_chain_b = param()
     zeroed = param(0.0001)
@@ -188,23 +230,31 @@ class PV_MagDiv(PV_ChainUGen):
 
 @ugen(kr=True, is_width_first=True)
 class PV_MagFreeze(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     freeze = param(0)
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_MagMul(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain_a = param()
     pv_chain_b = param()
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_MagNoise(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_MagShift(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     stretch = param(1.0)
     shift = param(0.0)
@@ -212,35 +262,47 @@ class PV_MagShift(PV_ChainUGen):
 
 @ugen(kr=True, is_width_first=True)
 class PV_MagSmear(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     bins = param(0)
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_MagSquared(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_Max(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain_a = param()
     pv_chain_b = param()
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_Min(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain_a = param()
     pv_chain_b = param()
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_Mul(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain_a = param()
     pv_chain_b = param()
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_PhaseShift(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     shift = param()
     integrate = param(0)
@@ -248,16 +310,22 @@ class PV_PhaseShift(PV_ChainUGen):
 
 @ugen(kr=True, is_width_first=True)
 class PV_PhaseShift270(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_PhaseShift90(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
 
 
 @ugen(kr=True, is_width_first=True)
 class PV_RandComb(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     wipe = param(0)
     trigger = param(0)
@@ -265,6 +333,8 @@ class PV_RandComb(PV_ChainUGen):
 
 @ugen(kr=True, is_width_first=True)
 class PV_RandWipe(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain_a = param()
     pv_chain_b = param()
     wipe = param(0)
@@ -273,6 +343,8 @@ class PV_RandWipe(PV_ChainUGen):
 
 @ugen(kr=True, is_width_first=True)
 class PV_RectComb(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain = param()
     num_teeth = param(0)
     phase = param(0)
@@ -281,6 +353,8 @@ class PV_RectComb(PV_ChainUGen):
 
 @ugen(kr=True, is_width_first=True)
 class PV_RectComb2(PV_ChainUGen):
+    __slots__ = ()
+
     pv_chain_a = param()
     pv_chain_b = param()
     num_teeth = param(0)
@@ -290,5 +364,7 @@ class PV_RectComb2(PV_ChainUGen):
 
 @ugen(ar=True, kr=True)
 class RunningSum(UGen):
+    __slots__ = ()
+
     source = param()
     sample_count = param(40)
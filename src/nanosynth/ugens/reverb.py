@@ -5,6 +5,8 @@ from ..synthdef import UGen, param, ugen
 
 @ugen(ar=True)
 class FreeVerb(UGen):
+    __slots__ = ()
+
     source = param()
     mix = param(0.33)
     room_size = param(0.5)
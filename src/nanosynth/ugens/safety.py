@@ -5,6 +5,8 @@ from ..synthdef import UGen, param, ugen
 
 @ugen(ar=True, kr=True)
 class CheckBadValues(UGen):
+    __slots__ = ()
+
     source = param()
     ugen_id = param(0)
     post_mode = param(2)
@@ -12,5 +14,7 @@ class CheckBadValues(UGen):
 
 @ugen(ar=True, kr=True)
 class Sanitize(UGen):
+    __slots__ = ()
+
     source = param()
     replace = param(0.0)
@@ -12,8 +12,18 @@ from ..synthdef import (
 )
 
 
+def _char_codes(text: str) -> list[int]:
+    # The Latin-1 codec yields code points without a per-character ord().
+    try:
+        return list(text.encode("latin-1"))
+    except UnicodeEncodeError:
+        return [ord(c) for c in text]
+
+
 @ugen(ar=True, kr=True, ir=True)
 class Clip(UGen):
+    __slots__ = ()
+
     source = param()
     minimum = param(0.0)
     maximum = param(1.0)
@@ -21,6 +31,8 @@ class Clip(UGen):
 
 @ugen(ar=True, kr=True, ir=True)
 class Fold(UGen):
+    __slots__ = ()
+
     source = param()
     minimum = param(0.0)
     maximum = param(1.0)
@@ -28,12 +40,16 @@ class Fold(UGen):
 
 @ugen(ar=True, kr=True)
 class Gate(UGen):
+    __slots__ = ()
+
     source = param()
     trigger = param(0)
 
 
 @ugen(ar=True, kr=True, ir=True)
 class InRange(UGen):
+    __slots__ = ()
+
     source = param()
     minimum = param(0.0)
     maximum = param(1.0)
@@ -41,36 +57,48 @@ class InRange(UGen):
 
 @ugen(ar=True, kr=True)
 class Latch(UGen):
+    __slots__ = ()
+
     source = param()
     trigger = param(0)
 
 
 @ugen(ar=True, kr=True)
 class LeastChange(UGen):
+    __slots__ = ()
+
     a = param(0)
     b = param(0)
 
 
 @ugen(ar=True, kr=True)
 class MostChange(UGen):
+    __slots__ = ()
+
     a = param(0)
     b = param(0)
 
 
 @ugen(ar=True, kr=True)
 class Peak(UGen):
+    __slots__ = ()
+
     source = param()
     trigger = param(0)
 
 
 @ugen(ar=True, kr=True)
 class PeakFollower(UGen):
+    __slots__ = ()
+
     source = param()
     decay = param(0.999)
 
 
 @ugen(ar=True, kr=True)
 class Phasor(UGen):
+    __slots__ = ()
+
     trigger = param(0)
     rate = param(1.0)
     start = param(0.0)
@@ -80,18 +108,24 @@ class Phasor(UGen):
 
 @ugen(ar=True, kr=True)
 class RunningMax(UGen):
+    __slots__ = ()
+
     source = param()
     trigger = param(0)
 
 
 @ugen(ar=True, kr=True)
 class RunningMin(UGen):
+    __slots__ = ()
+
     source = param()
     trigger = param(0)
 
 
 @ugen(ar=True, kr=True)
 class Schmidt(UGen):
+    __slots__ = ()
+
     source = param()
     minimum = param(0.0)
     maximum = param(1.0)
@@ -99,6 +133,8 @@ class Schmidt(UGen):
 
 @ugen(ar=True, kr=True)
 class SendTrig(UGen):
+    __slots__ = ()
+
     trigger = param()
     id_ = param(0)
     value = param(0.0)
@@ -106,35 +142,47 @@ class SendTrig(UGen):
 
 @ugen(ar=True, kr=True)
 class Sweep(UGen):
+    __slots__ = ()
+
     trigger = param(0)
     rate = param(1.0)
 
 
 @ugen(ar=True, kr=True)
 class TDelay(UGen):
+    __slots__ = ()
+
     source = param()
     duration = param(0.1)
 
 
 @ugen(ar=True, kr=True)
 class ToggleFF(UGen):
+    __slots__ = ()
+
     trigger = param(0)
 
 
 @ugen(ar=True, kr=True)
 class Trig1(UGen):
+    __slots__ = ()
+
     source = param()
     duration = param(0.1)
 
 
 @ugen(ar=True, kr=True)
 class Trig(UGen):
+    __slots__ = ()
+
     source = param()
     duration = param(0.1)
 
 
 @ugen(ar=True, kr=True, ir=True)
 class Wrap(UGen):
+    __slots__ = ()
+
     source = param()
     minimum = param(0.0)
     maximum = param(1.0)
@@ -142,11 +190,15 @@ class Wrap(UGen):
 
 @ugen(ar=True, kr=True)
 class ZeroCrossing(UGen):
+    __slots__ = ()
+
     source = param()
 
 
 @ugen(ar=True, kr=True)
 class Poll(UGen):
+    __slots__ = ()
+
     trigger = param()
     source = param()
     trigger_id = param(-1)
@@ -174,7 +226,7 @@ class Poll(UGen):
         UGen.__init__(
             self,
             calculation_rate=calculation_rate,
-            label=[len(label_str), *(ord(c) for c in label_str)],
+            label=[len(label_str), *_char_codes(label_str)],
             source=source,
             trigger=trigger,
             trigger_id=trigger_id,
@@ -217,6 +269,8 @@ class Poll(UGen):
 
 @ugen(ar=True, kr=True, channel_count=0, fixed_channel_count=True)
 class SendPeakRMS(UGen):
+    __slots__ = ()
+
     reply_rate = param(20)
     peak_lag = param(3)
     reply_id = param(-1)
@@ -244,7 +298,7 @@ class SendPeakRMS(UGen):
             source=source,
             source_size=len(source),  # type: ignore[arg-type]
             character_count=len(command),
-            character=[ord(x) for x in command],
+            character=_char_codes(command),
         )
 
     @classmethod
@@ -266,12 +320,14 @@ class SendPeakRMS(UGen):
             source=source,
             source_size=len(source),  # type: ignore[arg-type]
             character_count=len(command),
-            character=[ord(x) for x in command],
+            character=_char_codes(command),
         )
 
 
 @ugen(ar=True, kr=True, channel_count=0, fixed_channel_count=True)
 class SendReply(UGen):
+    __slots__ = ()
+
     trigger = param()
     reply_id = param(-1)
     character_count = param()
@@ -293,7 +349,7 @@ class SendReply(UGen):
             trigger=trigger,
             reply_id=reply_id,
             character_count=len(command),
-            character=[ord(x) for x in command],
+            character=_char_codes(command),
             source=source,
         )
 
@@ -312,6 +368,6 @@ class SendReply(UGen):
             trigger=trigger,
             reply_id=reply_id,
             character_count=len(command),
-            character=[ord(x) for x in command],
+            character=_char_codes(command),
             source=source,
         )
@@ -115,3 +115,21 @@ class TestSerializeCleanup:
             Out.ar(bus=0, source=SinOsc.ar() * env)
         sd = builder.build(name="test")
         assert sd.compile()[:4] == b"SCgf"
+
+    def test_serialize_and_compile_are_cached(self) -> None:
+        """An envelope builds each wire format once and reuses it."""
+        env = Envelope.adsr()
+        assert env.serialize() is env.serialize()
+        assert env.compile() is env.compile()
+
+    def test_shared_envelope_across_synthdefs(self) -> None:
+        """Reusing one envelope in two SynthDefs compiles identically."""
+        from nanosynth.envelopes import EnvGen
+
+        env = Envelope.percussive()
+        compiled = []
+        for _ in range(2):
+            with SynthDefBuilder() as builder:
+                Out.ar(bus=0, source=SinOsc.ar() * EnvGen.kr(envelope=env))
+            compiled.append(builder.build(name="perc").compile())
+        assert compiled[0] == compiled[1]
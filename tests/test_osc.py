@@ -5,7 +5,7 @@ import struct
 import pytest
 
 import nanosynth.osc
-from nanosynth.osc import OscBundle, OscMessage
+from nanosynth.osc import OscBundle, OscMessage, format_datagram
 
 
 @pytest.fixture(params=["native", "python"])
@@ -100,6 +100,19 @@ class TestOscMessage:
         assert decoded.contents[4] is None
         assert decoded.contents[5] == blob
 
+    def test_numeric_subclasses(self):
+        class Index(int):
+            pass
+
+        class Level(float):
+            pass
+
+        msg = OscMessage("/test", Index(3), Level(0.5), True)
+        datagram = msg.to_datagram()
+        decoded = OscMessage.from_datagram(datagram)
+        assert decoded.contents == (3, 0.5, True)
+        assert datagram == OscMessage("/test", 3, 0.5, True).to_datagram()
+
     def test_int_address(self):
         msg = OscMessage(42, "hello")
         datagram = msg.to_datagram()
@@ -131,6 +144,21 @@ class TestOscMessage:
         with pytest.raises(ValueError):
             OscMessage(3.14, 1)  # type: ignore
 
+    def test_slotted(self):
+        msg = OscMessage("/test", 1)
+        assert not hasattr(msg, "__dict__")
+        assert not hasattr(OscBundle(contents=(msg,)), "__dict__")
+
+
+class TestPythonEncoder:
+    def test_reuses_encoded_patterns(self, monkeypatch):
+        monkeypatch.setattr("nanosynth.osc._osc_native", None)
+        first = OscMessage("/n_set", 1000, "freq", 440.0).to_datagram()
+        hits = nanosynth.osc._encode_pattern.cache_info().hits
+        second = OscMessage("/n_set", 1001, "amp", 0.5).to_datagram()
+        assert nanosynth.osc._encode_pattern.cache_info().hits == hits + 2
+        assert first[:16] == second[:16] == b"/n_set\x00\x00,isf\x00\x00\x00\x00"
+
 
 @pytest.mark.usefixtures("osc_backend")
 class TestOscBundle:
@@ -200,3 +228,16 @@ class TestOscBundle:
         assert isinstance(decoded_msg, OscMessage)
         assert decoded_msg.address == "/foo"
         assert decoded_msg.contents[0] == 1
+
+
+class TestFormatDatagram:
+    def test_hex_and_ascii_columns(self):
+        text = format_datagram(b"/abc\x00\x00\x00\x00,i\x00\x00\x00\x00\x00\x2a\x01")
+        lines = text.split("\n")
+        assert lines[0] == "size 17"
+        assert lines[1] == (
+            "   0   2f 61 62 63  00 00 00 00  2c 69 00 00  00 00 00 2a   "
+            "|/abc....,i.....*|"
+        )
+        assert lines[2].startswith("  16   01")
+        assert lines[2].endswith("|.|")
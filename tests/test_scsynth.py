@@ -1,5 +1,6 @@
 """Basic tests for scsynth module."""
 
+import dataclasses
 import sys
 from types import ModuleType
 from unittest.mock import MagicMock
@@ -51,6 +52,11 @@ class TestOptions:
         with pytest.raises(AttributeError):
             opts.port = 9999  # type: ignore
 
+    def test_slotted(self):
+        opts = Options()
+        assert not hasattr(opts, "__dict__")
+        assert dataclasses.replace(opts, port=9999).port == 9999
+
     def test_first_private_bus_id(self):
         opts = Options()
         assert opts.first_private_bus_id == 16  # 8 in + 8 out
@@ -144,6 +150,11 @@ class TestEmbeddedProcessProtocol:
         with pytest.raises(RuntimeError, match="not running"):
             proto.send_msg("/test")
 
+    def test_slotted(self):
+        proto = EmbeddedProcessProtocol()
+        assert not hasattr(proto, "__dict__")
+        assert EmbeddedProcessProtocol._active_world is False
+
     def test_name_stored(self):
         proto = EmbeddedProcessProtocol(name="test-server")
         assert proto.name == "test-server"
@@ -1,5 +1,6 @@
 """Tests for the high-level Server class."""
 
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -170,6 +171,70 @@ class TestServerOscEncoding:
         assert abs(msg.contents[2] - 880.0) < 0.01
 
 
+class TestBundle:
+    @pytest.fixture()
+    def server(self) -> Server:
+        s = Server()
+        s._protocol = MagicMock()
+        s._protocol.status = BootStatus.ONLINE
+        return s
+
+    def test_bundle_sends_one_packet(self, server: Server) -> None:
+        """Messages sent inside bundle() arrive as a single OSC bundle."""
+        from nanosynth.osc import OscBundle
+
+        with server.bundle():
+            node = server.synth("sine", frequency=440.0)
+            node.set(amplitude=0.5)
+            with server.bundle():
+                server.free(node)
+            server._protocol.send_packet.assert_not_called()
+        server._protocol.send_packet.assert_called_once()
+        data = server._protocol.send_packet.call_args[0][0]
+        bundle = OscBundle.from_datagram(data)
+        assert bundle.timestamp is None
+        assert [msg.address for msg in bundle.contents] == [
+            "/s_new",
+            "/n_set",
+            "/n_free",
+        ]
+
+    def test_bundle_empty_sends_nothing(self, server: Server) -> None:
+        with server.bundle():
+            pass
+        server._protocol.send_packet.assert_not_called()
+
+    def test_bundle_only_collects_calling_thread(self, server: Server) -> None:
+        """Messages sent from other threads during a bundle go out immediately."""
+        import threading
+
+        from nanosynth.osc import OscMessage
+
+        with server.bundle():
+            server.synth("sine")
+            t = threading.Thread(target=server.free, args=(1,))
+            t.start()
+            t.join()
+            server._protocol.send_packet.assert_called_once()
+            data = server._protocol.send_packet.call_args[0][0]
+            assert OscMessage.from_datagram(data).address == "/n_free"
+        assert server._protocol.send_packet.call_count == 2
+
+    def test_send_msg_sync_inside_bundle_raises(self, server: Server) -> None:
+        with server.bundle(), pytest.raises(RuntimeError):
+            server.send_msg_sync("/sync", 1, reply_address="/synced")
+        server._protocol.send_packet.assert_not_called()
+        assert "/synced" not in server._pending_replies
+
+    def test_bundle_discarded_on_exception(self, server: Server) -> None:
+        with pytest.raises(RuntimeError), server.bundle():
+            server.synth("sine")
+            raise RuntimeError("boom")
+        server._protocol.send_packet.assert_not_called()
+        server.free(1000)
+        server._protocol.send_packet.assert_called_once()
+
+
 class TestManagedSynth:
     """Tests for managed_synth and managed_group context managers."""
 
@@ -400,6 +465,14 @@ class TestBufferManagement:
         assert s._protocol.send_packet.call_count == 1
 
 
+def _wait_until_registered(server: Server, address: str) -> None:
+    """Block until a waiter thread has registered for *address*."""
+    deadline = time.monotonic() + 2.0
+    while address not in server._pending_replies:
+        assert time.monotonic() < deadline, f"no waiter registered for {address}"
+        time.sleep(0.001)
+
+
 class TestReplyHandling:
     """Tests for reply dispatch, on/off handlers, and wait_for_reply."""
 
@@ -449,10 +522,7 @@ class TestReplyHandling:
 
         t = threading.Thread(target=waiter)
         t.start()
-        # Give the waiter time to register
-        import time
-
-        time.sleep(0.05)
+        _wait_until_registered(server, "/done")
         reply_msg = OscMessage("/done", "/b_alloc", 0)
         server._dispatch_reply(reply_msg.to_datagram())
         t.join(timeout=2.0)
@@ -462,6 +532,7 @@ class TestReplyHandling:
     def test_wait_for_reply_timeout_returns_none(self, server: Server) -> None:
         result = server.wait_for_reply("/nonexistent", timeout=0.05)
         assert result is None
+        assert "/nonexistent" not in server._pending_replies
 
     def test_send_msg_sync_with_mock(self, server: Server) -> None:
         import threading
@@ -482,9 +553,7 @@ class TestReplyHandling:
 
         t = threading.Thread(target=caller)
         t.start()
-        import time
-
-        time.sleep(0.05)
+        _wait_until_registered(server, "/done")
         reply_msg = OscMessage("/done", "/b_alloc", 0)
         server._dispatch_reply(reply_msg.to_datagram())
         t.join(timeout=2.0)
@@ -496,6 +565,15 @@ class TestReplyHandling:
     def test_dispatch_invalid_data_does_not_raise(self, server: Server) -> None:
         server._dispatch_reply(b"\x00\x00\x00")  # invalid OSC data
 
+    def test_dispatch_skips_decoding_unobserved_replies(self, server: Server) -> None:
+        from nanosynth.osc import OscMessage
+
+        server.on("/done", MagicMock())
+        datagram = OscMessage("/status.reply", 1, 0, 0).to_datagram()
+        with patch.object(OscMessage, "from_datagram") as from_datagram:
+            server._dispatch_reply(datagram)
+        from_datagram.assert_not_called()
+
     def test_multiple_handlers_all_called(self, server: Server) -> None:
         from nanosynth.osc import OscMessage
 
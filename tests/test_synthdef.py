@@ -688,6 +688,32 @@ class TestUgenDecorator:
         assert data[:4] == b"SCgf"
         assert b"MyOsc" in data
 
+    def test_ugen_shared_signature_compiles_once(self):
+        """Classes with identical signatures reuse one compiled code object."""
+
+        @ugen(ar=True, kr=True)
+        class OscA(UGen):
+            frequency = param(440.0)
+
+        @ugen(ar=True, kr=True)
+        class OscB(UGen):
+            frequency = param(440.0)
+
+        assert OscA.ar.__func__.__code__ is OscB.ar.__func__.__code__
+        assert OscA.ar.__qualname__.endswith("OscA.ar")
+        assert OscB.ar.__qualname__.endswith("OscB.ar")
+
+    def test_ugen_accepts_supports_float_inputs(self):
+        """Objects implementing __float__ still count as scalar inputs."""
+
+        class Hz:
+            def __float__(self) -> float:
+                return 220.0
+
+        with SynthDefBuilder():
+            sig = SinOsc.ar(frequency=Hz())
+        assert sig.ugen.inputs == (220.0, 0.0)
+
 
 # ---------------------------------------------------------------------------
 # SynthDefBuilder scope error tests
@@ -1711,6 +1737,42 @@ class TestExtendedOperators:
         assert isinstance(result, ConstantProxy)
         assert float(result) == 0.0  # False -> 0.0
 
+    def test_midicps_constant_folding(self):
+        result = ConstantProxy(69.0).midicps()
+        assert isinstance(result, ConstantProxy)
+        assert float(result) == 440.0
+
+    def test_dbamp_constant_folding(self):
+        result = ConstantProxy(-20.0).dbamp()
+        assert isinstance(result, ConstantProxy)
+        assert abs(float(result) - 0.1) < 1e-10
+
+    def test_softclip_constant_folding(self):
+        assert float(ConstantProxy(0.25).softclip()) == 0.25
+        assert float(ConstantProxy(1.0).softclip()) == 0.75
+
+    def test_unary_folds_constant_vector_elements(self):
+        """Constant channels of a mixed vector fold independently."""
+        with SynthDefBuilder():
+            result = -UGenVector(SinOsc.ar(), ConstantProxy(3.0))
+            assert isinstance(result, UGenVector)
+            assert isinstance(result[0], OutputProxy)
+            assert isinstance(result[1], ConstantProxy)
+            assert float(result[1]) == -3.0
+
+    def test_double_negation_collapses(self):
+        with SynthDefBuilder():
+            sig = SinOsc.ar()
+            negated = -sig
+            assert -negated is sig
+
+    def test_zero_minus_negation_collapses(self):
+        with SynthDefBuilder() as builder:
+            sig = SinOsc.ar()
+            Out.ar(bus=0, source=0 - (-sig))
+        sd = builder.build(name="test")
+        assert not any(isinstance(u, UnaryOpUGen) for u in sd.ugens)
+
     # -- equal / not_equal methods ---------------------------------------------
 
     def test_equal_method(self):
@@ -1777,8 +1839,28 @@ class TestUGenOperableBoolTrap:
         assert not (cp1 == ConstantProxy(2.0))
 
 
+class TestOutputProxyHash:
+    def test_hash_matches_equal_proxy(self):
+        with SynthDefBuilder():
+            sig = SinOsc.ar()
+        proxy = OutputProxy(ugen=sig.ugen, index=0)
+        assert proxy == sig
+        assert hash(proxy) == hash(sig)
+
+    def test_deepcopy_rehashes_against_copied_ugen(self):
+        import copy
+
+        with SynthDefBuilder():
+            sig = SinOsc.ar()
+        ugen_copy = copy.deepcopy(sig.ugen)
+        proxy_copy = ugen_copy[0]
+        assert proxy_copy.ugen is ugen_copy
+        assert hash(proxy_copy) == hash(OutputProxy(ugen=ugen_copy, index=0))
+        assert {proxy_copy: 1}[OutputProxy(ugen=ugen_copy, index=0)] == 1
+
+
 class TestThreadLocalGuard:
-    """Test that the centralized _get_active_builders works across threads."""
+    """Test that the centralized _get_active_builders is context-local."""
 
     def test_builders_isolated_across_threads(self):
         import threading
@@ -1800,7 +1882,35 @@ class TestThreadLocalGuard:
         from nanosynth.synthdef import _get_active_builders
 
         builders = _get_active_builders()
-        assert isinstance(builders, list)
+        assert isinstance(builders, tuple)
+
+    def test_builders_isolated_across_asyncio_tasks(self):
+        import asyncio
+
+        from nanosynth.synthdef import _get_active_builders
+
+        async def outer() -> int:
+            with SynthDefBuilder():
+                await asyncio.sleep(0)
+                return len(_get_active_builders())
+
+        async def inner() -> int:
+            await asyncio.sleep(0)
+            return len(_get_active_builders())
+
+        async def main() -> list[int]:
+            return list(await asyncio.gather(outer(), inner()))
+
+        assert asyncio.run(main()) == [1, 0]
+
+    def test_nested_builder_stack_restored(self):
+        from nanosynth.synthdef import _get_active_builders
+
+        with SynthDefBuilder() as outer:
+            with SynthDefBuilder() as inner:
+                assert _get_active_builders() == (outer, inner)
+            assert _get_active_builders() == (outer,)
+        assert _get_active_builders() == ()
 
 
 class TestTopologicalSortDescendantOrdering:
@@ -1975,3 +2085,131 @@ class TestTupleSyntax:
         assert "freq" in sd.parameters
         assert "amp" in sd.parameters
         assert "bus" in sd.parameters
+
+
+# ---------------------------------------------------------------------------
+# Commutative operand normalization
+# ---------------------------------------------------------------------------
+
+
+class TestCommutativeNormalization:
+    def test_operand_order_does_not_change_bytes(self):
+        """x * 0.5 and 0.5 * x compile to identical SynthDefs."""
+        with SynthDefBuilder() as builder_a:
+            Out.ar(bus=0, source=SinOsc.ar() * 0.5)
+        with SynthDefBuilder() as builder_b:
+            Out.ar(bus=0, source=0.5 * SinOsc.ar())
+        sd_a = builder_a.build(name="test")
+        sd_b = builder_b.build(name="test")
+        assert sd_a.compile() == sd_b.compile()
+
+    def test_constant_moved_first(self):
+        """Commutative operators place the constant operand first."""
+        with SynthDefBuilder() as builder:
+            Out.ar(bus=0, source=SinOsc.ar() + 0.25)
+        synthdef = builder.build(name="test")
+        binary_ops = [u for u in synthdef.ugens if isinstance(u, BinaryOpUGen)]
+        assert len(binary_ops) == 1
+        assert binary_ops[0].inputs[0] == 0.25
+
+    @pytest.mark.parametrize(
+        "build",
+        [
+            lambda sig: sig * 0.5,
+            lambda sig: sig + 0.5,
+            lambda sig: sig.min_(0.5),
+            lambda sig: sig.max_(0.5),
+            lambda sig: sig.equal(0.5),
+            lambda sig: sig.not_equal(0.5),
+        ],
+    )
+    def test_constant_first_for_each_commutative_operator(self, build):
+        with SynthDefBuilder() as builder:
+            Out.ar(bus=0, source=build(SinOsc.ar()))
+        synthdef = builder.build(name="test")
+        (binary_op,) = [u for u in synthdef.ugens if isinstance(u, BinaryOpUGen)]
+        assert binary_op.inputs[0] == 0.5
+        assert isinstance(binary_op.inputs[1], OutputProxy)
+
+    def test_constant_first_pins_compiled_output(self):
+        """The canonical order is part of the compiled bytes and anonymous names."""
+        with SynthDefBuilder() as builder:
+            Out.ar(bus=0, source=SinOsc.ar() * 0.5)
+        assert builder.build().anonymous_name == "aea3321517c8657dae4fc4d05ddf3906"
+
+    def test_non_commutative_order_preserved(self):
+        """Subtraction keeps its operand order."""
+        with SynthDefBuilder() as builder:
+            Out.ar(bus=0, source=SinOsc.ar() - 0.25)
+        synthdef = builder.build(name="test")
+        binary_ops = [u for u in synthdef.ugens if isinstance(u, BinaryOpUGen)]
+        assert len(binary_ops) == 1
+        assert binary_ops[0].inputs[1] == 0.25
+
+
+# ---------------------------------------------------------------------------
+# Slotted graph classes
+# ---------------------------------------------------------------------------
+
+
+class TestSlots:
+    def test_graph_nodes_have_no_instance_dict(self):
+        """Core graph classes are fully slotted."""
+        with SynthDefBuilder(freq=440.0) as builder:
+            Out.ar(bus=0, source=SinOsc.ar(frequency=builder["freq"]) * 0.5)
+        synthdef = builder.build(name="test")
+        for node in synthdef.ugens:
+            if isinstance(node, (BinaryOpUGen, Control)):
+                assert not hasattr(node, "__dict__")
+        assert not hasattr(Parameter(name="freq", value=440.0), "__dict__")
+
+    def test_builtin_ugens_are_slotted(self):
+        """Built-in UGens declare empty __slots__ in their class bodies."""
+        with SynthDefBuilder():
+            sig = Pan2.ar(source=SinOsc.ar())
+            env = EnvGen.kr(envelope=Envelope.percussive())
+        assert "__slots__" in SinOsc.__dict__
+        assert not hasattr(sig[0].ugen, "__dict__")
+        assert not hasattr(env.ugen, "__dict__")
+        assert len(sig) == 2
+
+    def test_decorated_ugen_zero_argument_super(self):
+        @ugen(ar=True)
+        class Custom(UGen):
+            source = param(0.0)
+
+            def _postprocess_kwargs(self, *, calculation_rate, **kwargs):
+                return super()._postprocess_kwargs(
+                    calculation_rate=calculation_rate, **kwargs
+                )
+
+        with SynthDefBuilder():
+            sig = Custom.ar(source=1.0)
+        assert sig.ugen.inputs == (1.0,)
+
+    def test_every_builtin_ugen_class_declares_slots(self):
+        import importlib
+        import pkgutil
+
+        import nanosynth.ugens
+
+        for info in pkgutil.iter_modules(nanosynth.ugens.__path__):
+            module = importlib.import_module(f"nanosynth.ugens.{info.name}")
+            for value in vars(module).values():
+                if isinstance(value, type) and issubclass(value, UGen):
+                    for class_ in value.__mro__[:-1]:
+                        assert "__slots__" in class_.__dict__, class_.__qualname__
+
+    def test_user_ugens_keep_instance_dict_and_weakrefs(self):
+        """@ugen does not rebuild user classes that omit __slots__."""
+        import weakref
+
+        class Custom(UGen):
+            source = param(0.0)
+
+        decorated = ugen(ar=True)(Custom)
+        assert decorated is Custom
+        with SynthDefBuilder():
+            node = Custom.ar(source=1.0).ugen
+        node.note = 1
+        assert weakref.ref(node)() is node
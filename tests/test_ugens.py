@@ -4,10 +4,23 @@ Each test builds a minimal SynthDef using the UGen and verifies it compiles
 to valid SCgf output.
 """
 
+import sys
+
 import pytest
 
-from nanosynth.synthdef import SynthDefBuilder
+from nanosynth.synthdef import (
+    CalculationRate,
+    ConstantProxy,
+    OutputProxy,
+    SynthDefBuilder,
+    UGenVector,
+)
 from nanosynth.ugens import (
+    # basic
+    Mix,
+    MulAdd,
+    Sum3,
+    Sum4,
     # beq
     BAllPass,
     BBandPass,
@@ -64,6 +77,7 @@ from nanosynth.ugens import (
     DelayN,
     # demand
     Dbrown,
+    Demand,
     Dgeom,
     Drand,
     Dseq,
@@ -72,6 +86,7 @@ from nanosynth.ugens import (
     Dshuf,
     Duty,
     Dwhite,
+    Dwrand,
     Amplitude,
     Compander,
     Limiter,
@@ -112,6 +127,9 @@ from nanosynth.ugens import (
     Slope,
     TwoPole,
     TwoZero,
+    # gendyn
+    Gendy1,
+    Gendy3,
     # granular
     GrainBuf,
     GrainIn,
@@ -141,6 +159,7 @@ from nanosynth.ugens import (
     # inout
     In,
     InFeedback,
+    LocalIn,
     LocalOut,
     OffsetOut,
     Out,
@@ -153,6 +172,7 @@ from nanosynth.ugens import (
     DC,
     K2A,
     LinExp,
+    LinLin,
     Line,
     XLine,
     # noise
@@ -199,6 +219,7 @@ from nanosynth.ugens import (
     PanB,
     PanB2,
     Rotate2,
+    Splay,
     XFade2,
     # physical
     Ball,
@@ -217,7 +238,9 @@ from nanosynth.ugens import (
     Latch,
     Peak,
     Phasor,
+    Poll,
     Schmidt,
+    SendReply,
     SendTrig,
     Sweep,
     TDelay,
@@ -515,6 +538,14 @@ class TestLines:
             )
         )
 
+    def test_linlin_kr_matches_ar(self):
+        with SynthDefBuilder():
+            lfo = SinOsc.kr()
+            a = LinLin.ar(source=lfo, output_minimum=200, output_maximum=800)
+            k = LinLin.kr(source=lfo, output_minimum=200, output_maximum=800)
+        assert isinstance(a.ugen, MulAdd)
+        assert a.ugen.inputs == k.ugen.inputs == (lfo, 600.0, 200.0)
+
     def test_dc(self):
         _compile(lambda b: Out.ar(bus=0, source=DC.ar(source=0.5)))
 
@@ -614,6 +645,18 @@ class TestDelay:
 
 
 class TestTriggers:
+    def test_sendreply_command_codes(self):
+        with SynthDefBuilder():
+            reply = SendReply.kr(
+                command_name="/hi", trigger=Impulse.kr(), source=[SinOsc.kr()]
+            )
+        assert reply.inputs[2:6] == (3.0, 47.0, 104.0, 105.0)
+
+    def test_poll_label_beyond_latin1(self):
+        with SynthDefBuilder():
+            sig = Poll.kr(trigger=Impulse.kr(), source=SinOsc.kr(), label="\u03c9!")
+        assert sig.ugen.inputs[3:] == (2.0, 969.0, 33.0)
+
     def test_trig(self):
         _compile(lambda b: Out.ar(bus=0, source=Trig.ar(source=Dust.ar())))
 
@@ -815,6 +858,21 @@ class TestPanning:
             )
         )
 
+    def test_splay_graph_spread_uses_muladd(self):
+        with SynthDefBuilder() as builder:
+            Out.ar(
+                bus=0,
+                source=Splay.ar(
+                    source=[SinOsc.ar(frequency=f) for f in (220, 330, 440, 550)],
+                    spread=SinOsc.kr(frequency=0.1),
+                    center=SinOsc.kr(frequency=0.2),
+                ),
+            )
+        names = [type(u).__name__ for u in builder.build(name="splay").ugens]
+        # Channels 1 and 2 need a full multiply-add; the outer two reduce
+        # to a single subtraction and addition.
+        assert names.count("MulAdd") == 2
+
 
 # ---------------------------------------------------------------------------
 # IO (inout.py)
@@ -845,6 +903,16 @@ class TestInOut:
             )
         )
 
+    def test_localin_cycles_defaults(self):
+        with SynthDefBuilder():
+            sig = LocalIn.ar(channel_count=5, default=[1, 2])
+        assert sig[0].ugen.inputs == (1.0, 2.0, 1.0, 2.0, 1.0)
+
+    def test_localin_scalar_default(self):
+        with SynthDefBuilder():
+            sig = LocalIn.kr(channel_count=3, default=0.5)
+        assert sig[0].ugen.inputs == (0.5, 0.5, 0.5)
+
 
 # ---------------------------------------------------------------------------
 # Chaos (chaos.py)
@@ -1146,6 +1214,22 @@ class TestDemand:
             )
         )
 
+    def test_demand_channel_count_follows_source(self):
+        with SynthDefBuilder():
+            single = Demand.kr(trigger=Impulse.kr(), source=Dseq.dr(sequence=[1, 2]))
+            sources = UGenVector(Dseq.dr(sequence=[1, 2]), Dseq.dr(sequence=[3, 4]))
+            multi = Demand.kr(trigger=Impulse.kr(), source=sources)
+        assert len(single.ugen) == 1
+        assert len(multi) == 2
+
+    def test_dwrand_weights_fitted_to_sequence(self):
+        """Dwrand truncates surplus weights and zero-pads missing ones."""
+        with SynthDefBuilder():
+            short = Dwrand.dr(sequence=[1, 2, 3], weights=[0.5, 0.5])
+            long = Dwrand.dr(sequence=[1, 2], weights=[0.25, 0.75, 0.5])
+        assert short.ugen.inputs == (1.0, 3.0, 0.5, 0.5, 0.0, 1.0, 2.0, 3.0)
+        assert long.ugen.inputs == (1.0, 2.0, 0.25, 0.75, 1.0, 2.0)
+
 
 # ---------------------------------------------------------------------------
 # BufIO (bufio.py)
@@ -1181,3 +1265,118 @@ class TestBufIO:
                 Out.ar(bus=0, source=SinOsc.ar()),
             )
         )
+
+
+# ---------------------------------------------------------------------------
+# Gendy (gendyn.py)
+# ---------------------------------------------------------------------------
+
+
+class TestGendy:
+    def test_knum_defaults_to_init_cps(self):
+        with SynthDefBuilder():
+            sig = Gendy1.ar(init_cps=8)
+        assert sig.ugen.inputs[-1] == 8.0
+
+    def test_explicit_knum_kept(self):
+        with SynthDefBuilder():
+            sig = Gendy3.ar(init_cps=8, knum=4)
+        assert sig.ugen.inputs[-1] == 4.0
+
+
+# ---------------------------------------------------------------------------
+# Basic (basic.py)
+# ---------------------------------------------------------------------------
+
+
+class TestBasic:
+    def test_mix_deeply_nested_sources(self):
+        """Nesting deeper than the recursion limit still flattens."""
+        with SynthDefBuilder():
+            sig = SinOsc.ar()
+            sources: list = [sig, sig]
+            for _ in range(sys.getrecursionlimit() + 100):
+                sources = [sources]
+            mixed = Mix.new(sources)
+            assert mixed.ugen.inputs == (sig, sig)
+
+    def test_sum4_orders_inputs_by_rate(self):
+        """Sum4 puts the highest-rate inputs first and runs at that rate."""
+        with SynthDefBuilder():
+            control = SinOsc.kr()
+            audio = SinOsc.ar()
+            mixed = Mix.new([control, 0.5, audio, control])
+        assert isinstance(mixed.ugen, Sum4)
+        assert mixed.calculation_rate == CalculationRate.AUDIO
+        assert mixed.ugen.inputs == (audio, control, control, 0.5)
+
+    def test_mix_many_sources(self):
+        """Large mixes reduce to a single Sum4 tree output."""
+        with SynthDefBuilder():
+            sources = [SinOsc.ar(frequency=100 + i) for i in range(64)]
+            mixed = Mix.new(sources)
+        assert isinstance(mixed.ugen, Sum4)
+
+    def test_mix_empty_raises(self):
+        with SynthDefBuilder(), pytest.raises(ValueError, match="at least one source"):
+            Mix.new([])
+
+    def test_mix_expands_generators_and_ranges(self):
+        """Arbitrary iterables are mixed like lists, not passed through."""
+        with SynthDefBuilder():
+            sources = [SinOsc.ar(frequency=f) for f in (100, 200)]
+            from_list = Mix.new(list(sources))
+            from_generator = Mix.new(s for s in sources)
+            nested_generator = Mix.new([sources[0], (s for s in sources[1:])])
+            from_range = Mix.new([sources[0], range(1, 3)])
+        for mixed in (from_generator, nested_generator):
+            assert isinstance(mixed, OutputProxy)
+            assert mixed.ugen.inputs == from_list.ugen.inputs
+        assert isinstance(from_range.ugen, Sum3)
+        assert from_range.ugen.inputs == (sources[0], 1.0, 2.0)
+
+    def test_muladd_swaps_audio_multiplier_into_source(self):
+        """A control-rate source with an audio-rate multiplier is swapped."""
+        with SynthDefBuilder():
+            control = SinOsc.kr()
+            audio = SinOsc.ar()
+            result = MulAdd.new(source=control, multiplier=audio, addend=0.5)
+        assert isinstance(result.ugen, MulAdd)
+        assert result.calculation_rate == CalculationRate.AUDIO
+        assert result.ugen.inputs == (audio, control, 0.5)
+
+    def test_mix_flattens_multichannel_ugens(self):
+        """Multi-output UGens and UGenVectors contribute each channel."""
+        with SynthDefBuilder():
+            panned = Pan2.ar(source=SinOsc.ar())
+            vector = SinOsc.ar(frequency=[220, 330])
+            mixed = Mix.new([panned, vector])
+        assert isinstance(mixed.ugen, Sum4)
+        assert mixed.ugen.inputs == (panned[0], panned[1], vector[0], vector[1])
+
+    def test_mix_multichannel_interleaved_columns(self):
+        """Mix.multichannel sums every channel_count-th source per channel."""
+        with SynthDefBuilder():
+            sources = [SinOsc.ar(frequency=100 + i) for i in range(8)]
+            mixed = Mix.multichannel(sources, 2)
+        assert len(mixed) == 2
+        assert mixed[0].ugen.inputs == tuple(sources[0::2])
+        assert mixed[1].ugen.inputs == tuple(sources[1::2])
+
+    def test_constant_proxy_identities_short_circuit(self):
+        """ConstantProxy zeros and ones trigger the same shortcuts as floats."""
+        with SynthDefBuilder():
+            sig = SinOsc.ar()
+            assert MulAdd.new(source=sig, multiplier=ConstantProxy(1.0)) is sig
+            summed = Mix.new([sig, ConstantProxy(0.0), sig, ConstantProxy(0.0)])
+        assert not isinstance(summed.ugen, Sum4)
+
+    def test_expanded_constant_folds_are_wrapped(self):
+        """Constant-folded channels of an expanded UGen stay UGenOperables."""
+        with SynthDefBuilder():
+            result = MulAdd.new(
+                source=SinOsc.ar(frequency=[1, 2]), multiplier=0, addend=0.5
+            )
+        assert len(result) == 2
+        assert all(isinstance(x, ConstantProxy) for x in result)
+        assert float(result[0].midicps()) == pytest.approx(8.41536811)